@@ -66,6 +66,20 @@ class AliasDatabase:
         self.save()
         return is_new
 
+    def add_many(self, entries) -> int:
+        """
+        Agrega o actualiza varias entradas guardando a disco una sola vez.
+        Retorna cuántas fueron nuevas.
+        """
+        count = 0
+        for entry in entries:
+            key = entry.key()
+            if key not in self._entries:
+                count += 1
+            self._entries[key] = entry
+        self.save()
+        return count
+
     def remove(self, relay_model: str, relay_name: str) -> bool:
         """Elimina una entrada. Retorna True si existía."""
         key = f"{relay_model}::{relay_name}"
@@ -168,12 +182,7 @@ class AliasDatabase:
         """Importa entradas desde un archivo JSON externo. Retorna conteo."""
         with open(file_path, 'r', encoding='utf-8') as f:
             raw = json.load(f)
-        count = 0
-        for key, data in raw.items():
-            entry = AliasEntry(**data)
-            if self.add(entry):
-                count += 1
-        return count
+        return self.add_many(AliasEntry(**data) for data in raw.values())
 
     def export_to_json(self, file_path: str):
         """Exporta la base de datos a un archivo JSON."""
@@ -4,6 +4,7 @@ Extrae configuración del relé, señales analógicas (AxRADR) y binarias (BxRBD
 """
 import os
 import re
+import sys
 from lxml import etree
 from typing import Optional
 from models.signal_models import (
@@ -108,6 +109,11 @@ class XRIOParser:
             data.analog_signals = self._extract_analog_signals()
             data.binary_signals = self._extract_binary_signals()
             data.disturbance_report_signals = self._extract_disturbance_report_signals()
+            # Índice por nombre armado una sola vez (lo usa la comparación con el estándar)
+            data.dr_signals_by_name = {
+                sys.intern((s.name or "").strip().upper()): s
+                for s in data.disturbance_report_signals
+            }
             data.raw_xml_blocks = self._extract_raw_blocks()
 
         except etree.XMLSyntaxError as e:
@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 from ui.main_window import MainWindow
+from ui.styles import install_theme, init_tooltip_palette
 
 
 def main():
@@ -25,6 +26,8 @@ def main():
     app.setApplicationName("Validador de Estándar")
     app.setOrganizationName("ProtectionRelay")
     app.setApplicationVersion("1.0.0")
+    install_theme(app)
+    init_tooltip_palette()
 
     # Crear ventana principal
     window = MainWindow()
@@ -116,6 +116,8 @@ class XRIOData:
     analog_signals: list = field(default_factory=list)    # list[AnalogSignal]
     binary_signals: list = field(default_factory=list)    # list[BinarySignal]
     disturbance_report_signals: list = field(default_factory=list) # list[DisturbanceReportSignal]
+    # NOMBRE (sin espacios, mayúsculas, internado) -> DisturbanceReportSignal; lo arma el parser
+    dr_signals_by_name: dict = field(default_factory=dict, repr=False)
     raw_xml_blocks: dict = field(default_factory=dict)    # nombre_bloque -> xml_string
     file_path: str = ""
 
@@ -0,0 +1,49 @@
+"""
+Pruebas de la pestaña Diccionario de Alias (filtro por modelo).
+Requieren PyQt6; corren sin pantalla con la plataforma "offscreen".
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from core.alias_database import AliasDatabase
+from models.signal_models import AliasEntry
+from ui.dictionary_tab import DictionaryTab
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
+
+
+@pytest.fixture
+def alias_db(tmp_path):
+    return AliasDatabase(str(tmp_path / "alias_database.json"))
+
+
+def test_removed_filter_model_resets_proxy(qapp, alias_db):
+    """Al desaparecer el modelo filtrado, el combo cae a "Todos" y el proxy también."""
+    alias_db.add(AliasEntry(relay_name="IL1", standard_name="IA",
+                            relay_model="UNKNOWN"))
+    tab = DictionaryTab(alias_db)
+
+    combo = tab._combo_model
+    combo.setCurrentIndex(combo.findText("UNKNOWN"))
+    assert tab._proxy.rowCount() == 1
+
+    # Borrar todos los alias del modelo filtrado
+    alias_db.remove("UNKNOWN", "IL1")
+    tab.refresh()
+    assert combo.currentText() == "Todos"
+
+    # Una entrada de otro modelo debe quedar visible
+    tab.add_entries_from_validation([
+        AliasEntry(relay_name="UL1", standard_name="VA", relay_model="NEWMODEL")])
+    assert combo.currentText() == "Todos"
+    assert tab._proxy.rowCount() == 1
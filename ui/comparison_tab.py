@@ -27,6 +27,10 @@ _BLOCK_COLORS = [
     ("#6610f2", "#ffffff"),
 ]
 
+# Pinceles compartidos por todas las celdas
+_BRUSH_GREEN_DARK = QBrush(QColor("#198754"))
+_BRUSH_RED = QBrush(QColor("#dc3545"))
+
 class ComparisonBlockTable(QFrame):
     """Tabla que representa un bloque del estándar con estado de validación."""
     def __init__(self, block_name: str, standard_signals: list, xrio_signals: list,
@@ -61,6 +65,7 @@ class ComparisonBlockTable(QFrame):
 
         # Tabla
         table = QTableWidget()
+        table.setProperty("alternating", "true")
         table.setAlternatingRowColors(True)
         table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
@@ -80,11 +85,14 @@ class ComparisonBlockTable(QFrame):
         table.setColumnWidth(1, 180)
         table.setColumnWidth(2, 28)
 
-        green = QColor("#198754")
-        
-        # Normalizar nombres de señales XRIO para comparación (mayúsculas y quitar espacios)
-        xrio_names_norm = [s.strip().upper() for s in self._xrio_signals]
+        # Normalizar nombres de señales XRIO para comparación (mayúsculas y quitar espacios);
+        # set: búsqueda O(1) por fila en vez de recorrer la lista
+        xrio_names_norm = {s.strip().upper() for s in self._xrio_signals}
 
+        # Filas/columnas ya dimensionadas arriba; se llena sin repintar ni reordenar
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
         for r, sig in enumerate(self._standard_signals):
             std_name = sig['name']
             std_group = sig['group']
@@ -96,20 +104,22 @@ class ComparisonBlockTable(QFrame):
             v_text = "✔" if exists else ""
             chk = QTableWidgetItem(v_text)
             chk.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            chk.setForeground(QBrush(green))
+            chk.setForeground(_BRUSH_GREEN_DARK)
             table.setItem(r, 0, chk)
 
             # Nombre de la señal (del estándar)
             name_it = QTableWidgetItem(std_name)
             name_it.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
             if not exists:
-                name_it.setForeground(QBrush(QColor("#dc3545"))) # Rojo si falta
+                name_it.setForeground(_BRUSH_RED) # Rojo si falta
             table.setItem(r, 1, name_it)
 
             # Columna G (Grupo del estándar)
             g_it = QTableWidgetItem(std_group)
             g_it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             table.setItem(r, 2, g_it)
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(sorting)
 
         table.horizontalHeader().setStretchLastSection(False)
         layout.addWidget(table)
@@ -57,6 +57,7 @@ class XlsxBlockTable(QFrame):
         self._table = QTableWidget()
         self._table.setColumnCount(3)
         self._table.setHorizontalHeaderLabels(["Señal", "Descripción", "Start Std"])
+        self._table.setProperty("alternating", "true")
         self._table.setAlternatingRowColors(True)
         self._table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self._table.setEditTriggers(QTableWidget.EditTrigger.AllEditTriggers)
@@ -146,6 +147,7 @@ class ComtradeTab(QWidget):
         self._excel_parser: ExcelStandardParser | None = None
         self._excel_data: dict[str, dict[str, list[dict]]] = {}
         self._block_widgets: dict[str, XlsxBlockTable] = {}
+        self._block_order: list[str] = []  # índice de layout -> nombre de bloque
         self._setup_ui()
         self._load_default_xlsx()
 
@@ -159,11 +161,11 @@ class ComtradeTab(QWidget):
         top.setSpacing(6)
 
         self._btn_open = QPushButton("📂 Abrir XLSX")
-        self._btn_open.setProperty("cssClass", "primary")
+        self._btn_open.setObjectName("primaryButton")
         self._btn_open.clicked.connect(self._on_open_xlsx)
 
         self._btn_save = QPushButton("💾 Guardar XLSX")
-        self._btn_save.setProperty("cssClass", "success")
+        self._btn_save.setObjectName("successButton")
         self._btn_save.clicked.connect(self._on_save_xlsx)
 
         self._combo_sheet = QComboBox()
@@ -199,21 +201,21 @@ class ComtradeTab(QWidget):
         self._btn_add_sheet.clicked.connect(self._on_add_sheet)
 
         self._btn_del_sheet = QPushButton("🗑 Hoja")
-        self._btn_del_sheet.setProperty("cssClass", "danger")
+        self._btn_del_sheet.setObjectName("dangerButton")
         self._btn_del_sheet.clicked.connect(self._on_delete_sheet)
 
         self._btn_add_block = QPushButton("➕ Tabla")
         self._btn_add_block.clicked.connect(self._on_add_block)
 
         self._btn_del_block = QPushButton("🗑 Tabla")
-        self._btn_del_block.setProperty("cssClass", "danger")
+        self._btn_del_block.setObjectName("dangerButton")
         self._btn_del_block.clicked.connect(self._on_delete_block)
 
         self._btn_add_row = QPushButton("➕ Fila")
         self._btn_add_row.clicked.connect(self._on_add_row)
 
         self._btn_del_row = QPushButton("🗑 Fila")
-        self._btn_del_row.setProperty("cssClass", "danger")
+        self._btn_del_row.setObjectName("dangerButton")
         self._btn_del_row.clicked.connect(self._on_delete_row)
 
         self._lbl_stats = QLabel("0 tablas")
@@ -312,20 +314,36 @@ class ComtradeTab(QWidget):
             self._block_widgets["__empty__"] = empty  # type: ignore
             return
 
-        color_idx = 0
         for block_name, rows in blocks.items():
-            bg, fg = _BLOCK_COLORS[color_idx % len(_BLOCK_COLORS)]
-            widget = XlsxBlockTable(block_name, rows, bg, fg)
-            widget.data_changed.connect(self._on_block_data_changed)
-            self._grid.addWidget(widget)
-            self._block_widgets[block_name] = widget
-            color_idx += 1
+            self._insert_block_widget(block_name, rows)
+
+    def _insert_block_widget(self, block_name: str, rows: list):
+        """Inserta la tabla de un bloque al final, manteniendo índice de layout == índice en _block_order."""
+        idx = len(self._block_order)
+        bg, fg = _BLOCK_COLORS[idx % len(_BLOCK_COLORS)]
+        widget = XlsxBlockTable(block_name, rows, bg, fg)
+        widget.data_changed.connect(self._on_block_data_changed)
+        self._grid.insertWidget(idx, widget)
+        self._block_widgets[block_name] = widget
+        self._block_order.append(block_name)
+
+    def _remove_block_widget(self, block_name: str):
+        """Retira la tabla de un bloque por índice (takeAt) sin recorrer el layout."""
+        if block_name not in self._block_widgets:
+            return
+        idx = self._block_order.index(block_name)
+        item = self._grid.takeAt(idx)
+        if item is not None and item.widget() is not None:
+            item.widget().deleteLater()
+        del self._block_order[idx]
+        del self._block_widgets[block_name]
 
     def _clear_block_widgets(self):
         for w in self._block_widgets.values():
             self._grid.removeWidget(w)
             w.deleteLater()
         self._block_widgets.clear()
+        self._block_order.clear()
 
     def _on_block_data_changed(self, block_name: str, rows: list):
         sheet = self._combo_sheet.currentText().strip()
@@ -356,7 +374,9 @@ class ComtradeTab(QWidget):
         idx = self._combo_block.findText(block_name)
         if idx >= 0:
             self._combo_block.setCurrentIndex(idx)
-        self._build_block_tables(sheet)
+        if "__empty__" in self._block_widgets:
+            self._clear_block_widgets()
+        self._insert_block_widget(block_name, blocks[block_name])
         self.standard_changed.emit()
         self._update_stats()
 
@@ -413,7 +433,10 @@ class ComtradeTab(QWidget):
         if block in self._excel_data.get(sheet, {}):
             del self._excel_data[sheet][block]
         self._refresh_block_selector(sheet)
-        self._build_block_tables(sheet)
+        if self._excel_data.get(sheet):
+            self._remove_block_widget(block)
+        else:
+            self._build_block_tables(sheet)
         self.standard_changed.emit()
         self._update_stats()
 
@@ -463,6 +486,16 @@ class ComtradeTab(QWidget):
     def get_config(self):
         return None
 
+    def is_ready(self) -> bool:
+        """True si la hoja actual tiene al menos una señal con nombre."""
+        cfg = self.get_config()
+        if cfg is not None:
+            return cfg.total_channels > 0
+        sheet = self._combo_sheet.currentText().strip()
+        blocks = self._excel_data.get(sheet, {}) if sheet else {}
+        return any((row.get('name') or '').strip()
+                   for rows in blocks.values() for row in rows)
+
     def get_all_channel_names(self) -> list:
         sheet = self._combo_sheet.currentText().strip()
         blocks = self._excel_data.get(sheet, {}) if sheet else {}
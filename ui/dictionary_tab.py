@@ -3,28 +3,62 @@ Pestaña 3: Diccionario de Alias
 Base de datos dinámica que mapea nombres técnicos de relé a nombres estándar.
 """
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
     QPushButton, QLabel, QLineEdit, QComboBox, QHeaderView,
     QMessageBox, QFrame, QDialog, QFormLayout, QDialogButtonBox,
-    QFileDialog, QCheckBox
+    QFileDialog, QCheckBox, QStyledItemDelegate, QStyleOptionButton,
+    QStyle, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QEvent,
+    QSortFilterProxyModel, QTimer
+)
+from PyQt6.QtGui import QColor, QFont, QBrush
 
 from core.alias_database import AliasDatabase
 from models.signal_models import AliasEntry, ProtectionFunction
 
 
+# ── Colores de las columnas Auto-detectado / Validado (creados una sola vez) ──
+_COLOR_AUTO = "#ff9800"
+_COLOR_VALID = "#4caf50"
+_COLOR_INVALID = "#f44336"
+_BRUSH_ORANGE = QBrush(QColor(_COLOR_AUTO))
+_BRUSH_GREEN = QBrush(QColor(_COLOR_VALID))
+_BRUSH_RED = QBrush(QColor(_COLOR_INVALID))
+
+# (texto, dato) de cada ProtectionFunction, calculado una vez por proceso
+_PF_PAIRS = [(f.value, f.name) for f in ProtectionFunction]
+
+
+def _populate_function_combo(combo: QComboBox, all_label: str | None = None):
+    """Llena un combo con las funciones de protección (opcionalmente con "todas")."""
+    if all_label is not None:
+        combo.addItem(all_label, "ALL")
+    for text, name in _PF_PAIRS:
+        combo.addItem(text, name)
+
+
 class AddAliasDialog(QDialog):
     """Diálogo para agregar o editar un alias."""
 
     def __init__(self, entry: AliasEntry = None, parent=None):
         super().__init__(parent)
-        self.setWindowTitle(
-            "Editar Alias" if entry else "Agregar Alias")
         self.setMinimumWidth(450)
-        self._entry = entry
         self._setup_ui()
+        self.reset(entry)
+
+    def reset(self, entry: AliasEntry = None):
+        """Deja el diálogo listo para agregar (entry=None) o editar una entrada."""
+        self._entry = entry
+        self.setWindowTitle(
+            "Editar Alias" if entry else "Agregar Alias")
+        self._relay_name.clear()
+        self._standard_name.clear()
+        self._relay_model.clear()
+        self._signal_type.setCurrentIndex(0)
+        self._function.setCurrentIndex(0)
+        self._validated.setChecked(False)
         if entry:
             self._populate(entry)
 
@@ -50,8 +84,7 @@ class AddAliasDialog(QDialog):
         layout.addRow("Tipo de Señal:", self._signal_type)
 
         self._function = QComboBox()
-        for func in ProtectionFunction:
-            self._function.addItem(func.value, func.name)
+        _populate_function_combo(self._function)
         layout.addRow("Función:", self._function)
 
         self._validated = QCheckBox("Validado manualmente")
@@ -89,6 +122,199 @@ class AddAliasDialog(QDialog):
         )
 
 
+class AliasTableModel(QAbstractTableModel):
+    """Modelo de tabla sobre las entradas de la BD de alias (datos bajo demanda)."""
+
+    HEADERS = [
+        "Nombre Técnico", "Nombre Estándar", "Modelo Relé",
+        "Tipo", "Función", "Auto-detectado", "Validado", "Acciones"
+    ]
+    COLUMN_WIDTHS = [180, 160, 130, 70, 170, 100, 80]
+    ACTION_COLUMN = 7
+
+    def __init__(self, alias_db: AliasDatabase, parent=None):
+        super().__init__(parent)
+        self._db = alias_db
+        self._entries: list[AliasEntry] = []
+        # Textos de display por fila, precalculados al cargar/editar la fila
+        self._display: list[tuple] = []
+        # (relay_name.lower(), standard_name.lower()) por fila, para el filtro
+        self._lower: list[tuple[str, str]] = []
+        # clave "modelo::nombre" -> fila, para búsquedas O(1)
+        self._rows: dict[str, int] = {}
+        self._set_entries(alias_db.get_all())
+
+    @staticmethod
+    def _display_row(entry: AliasEntry) -> tuple:
+        return (
+            entry.relay_name,
+            entry.standard_name,
+            entry.relay_model,
+            entry.signal_type,
+            entry.function,
+            "✓" if entry.auto_detected else "—",
+            "✓" if entry.validated else "✗",
+        )
+
+    def _set_entries(self, entries: list):
+        self._entries = entries
+        self._display = [self._display_row(e) for e in entries]
+        self._lower = [(e.relay_name.lower(), e.standard_name.lower())
+                       for e in entries]
+        self._rows = {e.key(): row for row, e in enumerate(entries)}
+
+    def reload(self):
+        """Recarga las entradas desde la BD con un único reset del modelo."""
+        self.beginResetModel()
+        self._set_entries(self._db.get_all())
+        self.endResetModel()
+
+    def entry(self, row: int) -> AliasEntry | None:
+        if 0 <= row < len(self._entries):
+            return self._entries[row]
+        return None
+
+    def row_of(self, key: str) -> int:
+        """Fila de la entrada con la clave dada, o -1."""
+        return self._rows.get(key, -1)
+
+    # ---------- Cambios puntuales (sin reset) ----------
+
+    def update_row(self, row: int, entry: AliasEntry):
+        old_key = self._entries[row].key()
+        if old_key != entry.key():
+            del self._rows[old_key]
+            self._rows[entry.key()] = row
+        self._entries[row] = entry
+        self._display[row] = self._display_row(entry)
+        self._lower[row] = (entry.relay_name.lower(), entry.standard_name.lower())
+        self.dataChanged.emit(self.index(row, 0),
+                              self.index(row, self.columnCount() - 1))
+
+    def insert_row(self, entry: AliasEntry):
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.append(entry)
+        self._rows[entry.key()] = row
+        self._display.append(self._display_row(entry))
+        self._lower.append((entry.relay_name.lower(), entry.standard_name.lower()))
+        self.endInsertRows()
+
+    def remove_row(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        removed = self._entries.pop(row)
+        self._display.pop(row)
+        self._lower.pop(row)
+        del self._rows[removed.key()]
+        # Solo se desplazan las filas posteriores a la eliminada
+        for r in range(row, len(self._entries)):
+            self._rows[self._entries[r].key()] = r
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col < self.ACTION_COLUMN:
+                return self._display[row][col]
+            return None
+
+        if role == Qt.ItemDataRole.TextAlignmentRole and col >= 5:
+            return Qt.AlignmentFlag.AlignCenter
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            entry = self._entries[row]
+            if col == 5 and entry.auto_detected:
+                return _BRUSH_ORANGE
+            if col == 6:
+                return _BRUSH_GREEN if entry.validated else _BRUSH_RED
+
+        return None
+
+
+class AliasFilterProxy(QSortFilterProxyModel):
+    """Proxy de filtrado: texto + modelo + función + tipo sobre AliasTableModel."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search = ""
+        self._model_filter: str | None = None
+        self._func_filter: str | None = None
+        self._type_filter: str | None = None
+
+    def set_filters(self, search: str, model_filter: str | None,
+                    func_filter: str | None, type_filter: str | None):
+        """Actualiza los criterios; solo re-filtra si alguno cambió."""
+        criteria = (search.lower(), model_filter, func_filter, type_filter)
+        if criteria == (self._search, self._model_filter,
+                        self._func_filter, self._type_filter):
+            return
+        (self._search, self._model_filter,
+         self._func_filter, self._type_filter) = criteria
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        source = self.sourceModel()
+        entry = source._entries[source_row]
+
+        if self._search:
+            rn, sn = source._lower[source_row]
+            if self._search not in rn and self._search not in sn:
+                return False
+        if (self._model_filter is not None
+                and entry.relay_model != self._model_filter):
+            return False
+        if (self._func_filter is not None
+                and entry.function != self._func_filter):
+            return False
+        if (self._type_filter is not None
+                and entry.signal_type != self._type_filter):
+            return False
+        return True
+
+
+class EditButtonDelegate(QStyledItemDelegate):
+    """Dibuja un botón "Editar" por fila visible sin crear widgets por fila."""
+
+    edit_requested = pyqtSignal(int)  # fila (del modelo de la vista)
+
+    TEXT = "✏️ Editar"
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionButton()
+        opt.rect = option.rect.adjusted(2, 2, -2, -2)
+        opt.text = self.TEXT
+        opt.state = QStyle.StateFlag.State_Enabled
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            opt.state |= QStyle.StateFlag.State_MouseOver
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, opt, painter, widget)
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            self.edit_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class DictionaryTab(QWidget):
     """Pestaña del diccionario de alias."""
 
@@ -97,6 +323,8 @@ class DictionaryTab(QWidget):
     def __init__(self, alias_db: AliasDatabase, parent=None):
         super().__init__(parent)
         self._db = alias_db
+        self._cached_models: set[str] = set()
+        self._alias_dialog: AddAliasDialog | None = None
         self._setup_ui()
         self._refresh_table()
 
@@ -114,22 +342,29 @@ class DictionaryTab(QWidget):
         main_layout.addWidget(filter_bar)
 
         # --- Tabla principal ---
-        self._table = QTableWidget()
-        self._table.setColumnCount(8)
-        self._table.setHorizontalHeaderLabels([
-            "Nombre Técnico", "Nombre Estándar", "Modelo Relé",
-            "Tipo", "Función", "Auto-detectado", "Validado", "Acciones"
-        ])
+        self._model = AliasTableModel(self._db, self)
+        self._proxy = AliasFilterProxy(self)
+        self._proxy.setSourceModel(self._model)
+        self._table = QTableView()
+        self._table.setModel(self._proxy)
+        self._table.setProperty("alternating", "true")
         self._table.setAlternatingRowColors(True)
+        # Interactive + anchos iniciales: evita medir todas las celdas en cada cambio
         self._table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.Stretch)
+            QHeaderView.ResizeMode.Interactive)
+        for col, width in enumerate(AliasTableModel.COLUMN_WIDTHS):
+            self._table.setColumnWidth(col, width)
         self._table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows)
+            QAbstractItemView.SelectionBehavior.SelectRows)
         self._table.setEditTriggers(
-            QTableWidget.EditTrigger.NoEditTriggers)
+            QAbstractItemView.EditTrigger.NoEditTriggers)
         self._table.horizontalHeader().setSectionResizeMode(
-            7, QHeaderView.ResizeMode.Fixed)
-        self._table.setColumnWidth(7, 160)
+            AliasTableModel.ACTION_COLUMN, QHeaderView.ResizeMode.Fixed)
+        self._table.setColumnWidth(AliasTableModel.ACTION_COLUMN, 160)
+        self._edit_delegate = EditButtonDelegate(self._table)
+        self._edit_delegate.edit_requested.connect(self._on_edit_row)
+        self._table.setItemDelegateForColumn(
+            AliasTableModel.ACTION_COLUMN, self._edit_delegate)
         main_layout.addWidget(self._table, 1)
 
         # --- Barra de acciones ---
@@ -149,11 +384,11 @@ class DictionaryTab(QWidget):
 
         self._lbl_validated = QLabel("Validados: 0")
         self._lbl_validated.setObjectName("subtitle")
-        self._lbl_validated.setStyleSheet("color: #4caf50;")
+        self._lbl_validated.setStyleSheet(f"color: {_COLOR_VALID};")
 
         self._lbl_auto = QLabel("Auto-detectados: 0")
         self._lbl_auto.setObjectName("subtitle")
-        self._lbl_auto.setStyleSheet("color: #ff9800;")
+        self._lbl_auto.setStyleSheet(f"color: {_COLOR_AUTO};")
 
         layout.addWidget(title)
         layout.addStretch()
@@ -174,7 +409,13 @@ class DictionaryTab(QWidget):
         self._search_input = QLineEdit()
         self._search_input.setPlaceholderText(
             "🔍 Buscar por nombre técnico o estándar...")
-        self._search_input.textChanged.connect(self._apply_filter)
+        # Debounce: filtrar solo cuando el usuario deja de teclear
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self._apply_filter)
+        self._search_input.textChanged.connect(
+            lambda _text: self._search_timer.start())
 
         # Filtro por modelo
         lbl_model = QLabel("Modelo:")
@@ -185,9 +426,7 @@ class DictionaryTab(QWidget):
         # Filtro por función
         lbl_func = QLabel("Función:")
         self._combo_function = QComboBox()
-        self._combo_function.addItem("Todas", "ALL")
-        for func in ProtectionFunction:
-            self._combo_function.addItem(func.value, func.name)
+        _populate_function_combo(self._combo_function, "Todas")
         self._combo_function.currentIndexChanged.connect(self._apply_filter)
 
         # Filtro por tipo
@@ -212,15 +451,15 @@ class DictionaryTab(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         self._btn_add = QPushButton("➕  Agregar Alias")
-        self._btn_add.setProperty("cssClass", "primary")
+        self._btn_add.setObjectName("primaryButton")
         self._btn_add.clicked.connect(self._on_add)
 
         self._btn_remove = QPushButton("🗑  Eliminar Seleccionado")
-        self._btn_remove.setProperty("cssClass", "danger")
+        self._btn_remove.setObjectName("dangerButton")
         self._btn_remove.clicked.connect(self._on_remove)
 
         self._btn_validate = QPushButton("✅  Marcar Validado")
-        self._btn_validate.setProperty("cssClass", "success")
+        self._btn_validate.setObjectName("successButton")
         self._btn_validate.clicked.connect(self._on_validate)
 
         self._btn_import = QPushButton("📥  Importar JSON")
@@ -246,115 +485,107 @@ class DictionaryTab(QWidget):
 
     def _refresh_table(self):
         """Recarga toda la tabla desde la base de datos."""
-        entries = self._db.get_all()
-
-        self._table.setRowCount(0)
-        self._table.setRowCount(len(entries))
-
-        validated_count = 0
-        auto_count = 0
-
-        for row, entry in enumerate(entries):
-            self._table.setItem(row, 0, QTableWidgetItem(entry.relay_name))
-            self._table.setItem(
-                row, 1, QTableWidgetItem(entry.standard_name))
-            self._table.setItem(
-                row, 2, QTableWidgetItem(entry.relay_model))
-            self._table.setItem(
-                row, 3, QTableWidgetItem(entry.signal_type))
-            self._table.setItem(
-                row, 4, QTableWidgetItem(entry.function))
-
-            # Auto-detectado
-            auto_item = QTableWidgetItem("✓" if entry.auto_detected else "—")
-            auto_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if entry.auto_detected:
-                auto_item.setForeground(QColor("#ff9800"))
-                auto_count += 1
-            self._table.setItem(row, 5, auto_item)
-
-            # Validado
-            val_item = QTableWidgetItem("✓" if entry.validated else "✗")
-            val_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if entry.validated:
-                val_item.setForeground(QColor("#4caf50"))
-                validated_count += 1
-            else:
-                val_item.setForeground(QColor("#f44336"))
-            self._table.setItem(row, 6, val_item)
-
-            # Botón editar
-            btn_edit = QPushButton("✏️ Editar")
-            btn_edit.clicked.connect(
-                lambda _, e=entry: self._on_edit(e))
-            self._table.setCellWidget(row, 7, btn_edit)
+        self._table.setUpdatesEnabled(False)
+        try:
+            self._model.reload()
+            # Ajuste de anchos una sola vez por recarga completa
+            for col in range(AliasTableModel.ACTION_COLUMN):
+                self._table.resizeColumnToContents(col)
+        finally:
+            self._table.setUpdatesEnabled(True)
+            self._table.viewport().update()
+        self._update_summary()
+        self._refresh_model_combo()
+
+    def _update_summary(self):
+        """Actualiza los contadores sin tocar la tabla."""
+        entries = self._model._entries
+
+        validated_count = sum(1 for e in entries if e.validated)
+        auto_count = sum(1 for e in entries if e.auto_detected)
 
         # Actualizar contadores
         self._lbl_total.setText(f"Total: {len(entries)}")
         self._lbl_validated.setText(f"Validados: {validated_count}")
         self._lbl_auto.setText(f"Auto-detectados: {auto_count}")
 
-        # Actualizar filtro de modelos
+    def _refresh_model_combo(self):
+        """Reconstruye el filtro de modelos solo si el conjunto cambió."""
+        models = self._db.get_models()
+        new_models = set(models)
+        if new_models == self._cached_models:
+            return
+        self._cached_models = new_models
+
         self._combo_model.blockSignals(True)
         current_model = self._combo_model.currentText()
         self._combo_model.clear()
         self._combo_model.addItem("Todos", "ALL")
-        for model in self._db.get_models():
+        for model in models:
             self._combo_model.addItem(model)
         idx = self._combo_model.findText(current_model)
         if idx >= 0:
             self._combo_model.setCurrentIndex(idx)
         self._combo_model.blockSignals(False)
 
+        # Si el modelo filtrado desapareció el combo vuelve a "Todos" sin
+        # emitir señales: el proxy debe enterarse igual
+        if self._combo_model.currentText() != current_model:
+            self._apply_filter()
+
     def _apply_filter(self):
-        """Aplica los filtros a la tabla."""
-        search = self._search_input.text().lower()
-        model_filter = self._combo_model.currentData()
-        func_filter = self._combo_function.currentData()
+        """Aplica los filtros a la tabla (vía proxy)."""
+        model_filter = None
+        if self._combo_model.currentData() != "ALL":
+            model_filter = self._combo_model.currentText()
+
+        func_filter = None
+        func_name = self._combo_function.currentData()
+        if func_name and func_name != "ALL":
+            try:
+                func_filter = ProtectionFunction[func_name].value
+            except KeyError:
+                pass
+
         type_filter = self._combo_type.currentText()
+        if type_filter == "Todos":
+            type_filter = None
+
+        self._proxy.set_filters(self._search_input.text(), model_filter,
+                                func_filter, type_filter)
 
-        for row in range(self._table.rowCount()):
-            relay_name = self._table.item(row, 0)
-            std_name = self._table.item(row, 1)
-            model = self._table.item(row, 2)
-            sig_type = self._table.item(row, 3)
-            function = self._table.item(row, 4)
-
-            # Búsqueda por texto
-            text_match = (not search
-                          or (relay_name and search in
-                              relay_name.text().lower())
-                          or (std_name and search in
-                              std_name.text().lower()))
-
-            # Filtro modelo
-            model_match = (model_filter == "ALL"
-                           or (model and model.text()
-                               == self._combo_model.currentText()))
-
-            # Filtro función
-            func_match = True
-            if func_filter and func_filter != "ALL":
-                try:
-                    func_val = ProtectionFunction[func_filter].value
-                    func_match = (function and
-                                  function.text() == func_val)
-                except KeyError:
-                    pass
-
-            # Filtro tipo
-            type_match = (type_filter == "Todos"
-                          or (sig_type and
-                              sig_type.text() == type_filter))
-
-            visible = (text_match and model_match
-                       and func_match and type_match)
-            self._table.setRowHidden(row, not visible)
+    def _source_row(self, view_row: int) -> int:
+        """Fila del modelo fuente para una fila visible de la vista."""
+        if view_row < 0:
+            return -1
+        return self._proxy.mapToSource(self._proxy.index(view_row, 0)).row()
+
+    def _entry_at(self, view_row: int) -> AliasEntry | None:
+        return self._model.entry(self._source_row(view_row))
+
+    def _store_entry(self, entry: AliasEntry):
+        """Guarda una entrada en la BD y refleja solo esa fila en el modelo."""
+        if self._db.add(entry):
+            self._model.insert_row(entry)
+            return
+        row = self._model.row_of(entry.key())
+        if row < 0:
+            # Modelo y BD desincronizados: recargar en vez de pisar otra fila
+            self._model.reload()
+        else:
+            self._model.update_row(row, entry)
 
     # ======================== ACCIONES ========================
 
+    def _get_alias_dialog(self, entry: AliasEntry = None) -> AddAliasDialog:
+        """Diálogo de alias reutilizable, creado en el primer uso."""
+        if self._alias_dialog is None:
+            self._alias_dialog = AddAliasDialog(parent=self)
+        self._alias_dialog.reset(entry)
+        return self._alias_dialog
+
     def _on_add(self):
-        dlg = AddAliasDialog(parent=self)
+        dlg = self._get_alias_dialog()
         if dlg.exec() == QDialog.DialogCode.Accepted:
             entry = dlg.get_entry()
             if not entry.relay_name or not entry.standard_name:
@@ -362,54 +593,63 @@ class DictionaryTab(QWidget):
                     self, "Datos incompletos",
                     "Nombre técnico y estándar son obligatorios.")
                 return
-            self._db.add(entry)
-            self._refresh_table()
+            self._store_entry(entry)
+            self._update_summary()
+            self._refresh_model_combo()
             self.alias_changed.emit()
 
+    def _on_edit_row(self, row: int):
+        entry = self._entry_at(row)
+        if entry:
+            self._on_edit(entry)
+
     def _on_edit(self, entry: AliasEntry):
-        dlg = AddAliasDialog(entry, self)
+        dlg = self._get_alias_dialog(entry)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             # Remover viejo y agregar nuevo
-            self._db.remove(entry.relay_model, entry.relay_name)
-            new_entry = dlg.get_entry()
-            self._db.add(new_entry)
-            self._refresh_table()
+            if self._db.remove(entry.relay_model, entry.relay_name):
+                row = self._model.row_of(entry.key())
+                if row < 0:
+                    self._model.reload()
+                else:
+                    self._model.remove_row(row)
+            self._store_entry(dlg.get_entry())
+            self._update_summary()
+            self._refresh_model_combo()
             self.alias_changed.emit()
 
     def _on_remove(self):
-        row = self._table.currentRow()
-        if row < 0:
+        row = self._source_row(self._table.currentIndex().row())
+        entry = self._model.entry(row)
+        if entry is None:
             QMessageBox.warning(self, "Sin selección",
                                 "Seleccione una fila para eliminar.")
             return
 
-        relay_name = self._table.item(row, 0).text()
-        relay_model = self._table.item(row, 2).text()
-
         reply = QMessageBox.question(
             self, "Confirmar eliminación",
-            f"¿Eliminar alias '{relay_name}' → '{self._table.item(row, 1).text()}'?")
+            f"¿Eliminar alias '{entry.relay_name}' → '{entry.standard_name}'?")
 
         if reply == QMessageBox.StandardButton.Yes:
-            self._db.remove(relay_model, relay_name)
-            self._refresh_table()
+            self._db.remove(entry.relay_model, entry.relay_name)
+            self._model.remove_row(row)
+            self._update_summary()
+            self._refresh_model_combo()
             self.alias_changed.emit()
 
     def _on_validate(self):
-        row = self._table.currentRow()
-        if row < 0:
+        row = self._source_row(self._table.currentIndex().row())
+        entry = self._model.entry(row)
+        if entry is None:
             QMessageBox.warning(self, "Sin selección",
                                 "Seleccione una fila para validar.")
             return
 
-        relay_name = self._table.item(row, 0).text()
-        relay_model = self._table.item(row, 2).text()
-        entry = self._db.get(relay_model, relay_name)
-        if entry:
-            entry.validated = True
-            self._db.add(entry)
-            self._refresh_table()
-            self.alias_changed.emit()
+        entry.validated = True
+        self._db.add(entry)
+        self._model.update_row(row, entry)
+        self._update_summary()
+        self.alias_changed.emit()
 
     def _on_import(self):
         path, _ = QFileDialog.getOpenFileName(
@@ -461,6 +701,5 @@ class DictionaryTab(QWidget):
 
     def add_entries_from_validation(self, entries: list):
         """Agrega entradas múltiples desde la validación."""
-        for entry in entries:
-            self._db.add(entry)
+        self._db.add_many(entries)
         self._refresh_table()
@@ -1,15 +1,14 @@
 """
 Ventana principal — diseño compacto con tema claro.
 """
-import os
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
     QPushButton, QLabel, QStatusBar, QMessageBox
 )
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QIcon, QPixmap
+from PyQt6.QtGui import QFont, QIcon, QPixmap, QPixmapCache
 
-from ui.styles import APP_THEME
+from ui.styles import apply_accent
 from ui.xrio_tab import XRIOTab
 from ui.comtrade_tab import ComtradeTab
 from ui.dictionary_tab import DictionaryTab
@@ -17,6 +16,29 @@ from core.validator import SignalValidator
 from core.alias_database import AliasDatabase
 
 
+LOGO_PATH = "LOGO.png"
+
+
+def _logo_pixmap(key: str = "logo") -> QPixmap:
+    """Logo cacheado en QPixmapCache ("logo" original, "logo_header" escalado)."""
+    pix = QPixmapCache.find(key)
+    if pix is not None:
+        return pix
+    if key == "logo_header":
+        base = _logo_pixmap("logo")
+        if base.isNull():
+            return base
+        pix = base.scaled(110, 34,
+                          Qt.AspectRatioMode.KeepAspectRatio,
+                          Qt.TransformationMode.SmoothTransformation)
+    else:
+        pix = QPixmap(LOGO_PATH)
+        if pix.isNull():
+            return pix
+    QPixmapCache.insert(key, pix)
+    return pix
+
+
 class MainWindow(QMainWindow):
     """Ventana principal compacta y profesional."""
 
@@ -25,16 +47,17 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Validador de Estándar — Relés de Protección")
         self.setMinimumSize(1100, 680)
         self.resize(1280, 780)
-        self.setStyleSheet(APP_THEME)
 
-        logo_path = "LOGO.png"
-        if os.path.exists(logo_path):
-            self.setWindowIcon(QIcon(logo_path))
+        logo = _logo_pixmap()
+        if not logo.isNull():
+            self.setWindowIcon(QIcon(logo))
 
+        self._validate_ready = False
         self._alias_db = AliasDatabase()
         self._validator = SignalValidator(self._alias_db)
         self._setup_ui()
         self._connect_signals()
+        apply_accent(self)
 
     # ─── UI ───────────────────────────────────────────────────────────
     def _setup_ui(self):
@@ -49,13 +72,9 @@ class MainWindow(QMainWindow):
         header.setSpacing(8)
 
         lbl_logo = QLabel()
-        logo_path = "LOGO.png"
-        if os.path.exists(logo_path):
-            pix = QPixmap(logo_path)
-            if not pix.isNull():
-                lbl_logo.setPixmap(pix.scaled(110, 34,
-                                              Qt.AspectRatioMode.KeepAspectRatio,
-                                              Qt.TransformationMode.SmoothTransformation))
+        header_logo = _logo_pixmap("logo_header")
+        if not header_logo.isNull():
+            lbl_logo.setPixmap(header_logo)
 
         lbl_title = QLabel("Validador de Estándar")
         fnt = QFont("Segoe UI", 12, QFont.Weight.Bold)
@@ -75,7 +94,7 @@ class MainWindow(QMainWindow):
         header.addStretch()
 
         self._btn_validate = QPushButton("  Validar Señales")
-        self._btn_validate.setProperty("cssClass", "primary")
+        self._btn_validate.setObjectName("primaryButton")
         self._btn_validate.setEnabled(False)
         self._btn_validate.setFixedHeight(26)
         self._btn_validate.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -95,11 +114,15 @@ class MainWindow(QMainWindow):
 
         self._xrio_tab = XRIOTab()
         self._comtrade_tab = ComtradeTab()
-        self._dictionary_tab = DictionaryTab(self._alias_db)
+        # El diccionario se construye al mostrarse su pestaña por primera vez
+        self._dictionary_tab: DictionaryTab | None = None
 
         self._tabs.addTab(self._xrio_tab, "XRIO / Disturbance Report")
         self._tabs.addTab(self._comtrade_tab, "Estándar COMTRADE (XLSX)")
-        self._tabs.addTab(self._dictionary_tab, "Diccionario de Alias")
+        dict_idx = self._tabs.addTab(QWidget(), "Diccionario de Alias")
+
+        self._tab_factories = {dict_idx: self._create_dictionary_tab}
+        self._tabs.currentChanged.connect(self._materialize_tab)
 
         root.addWidget(self._tabs, 1)
 
@@ -115,7 +138,28 @@ class MainWindow(QMainWindow):
         self._xrio_tab.relay_detected.connect(self._on_relay_detected)
         self._comtrade_tab.comtrade_loaded.connect(self._on_comtrade_loaded)
         self._comtrade_tab.standard_changed.connect(self._on_standard_changed)
+
+    # ─── Pestañas diferidas ──────────────────────────────────────────
+    def _materialize_tab(self, index: int):
+        """Reemplaza el placeholder de una pestaña por su widget real (una vez)."""
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+        placeholder = self._tabs.widget(index)
+        title = self._tabs.tabText(index)
+        widget = factory()
+
+        self._tabs.blockSignals(True)
+        self._tabs.removeTab(index)
+        self._tabs.insertTab(index, widget, title)
+        self._tabs.setCurrentIndex(index)
+        self._tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _create_dictionary_tab(self) -> DictionaryTab:
+        self._dictionary_tab = DictionaryTab(self._alias_db)
         self._dictionary_tab.alias_changed.connect(self._on_alias_changed)
+        return self._dictionary_tab
 
     # ─── Slots ────────────────────────────────────────────────────────
     def _on_xrio_loaded(self, data):
@@ -139,22 +183,11 @@ class MainWindow(QMainWindow):
         self._status_label.setText("Diccionario de alias actualizado")
 
     def _check_validate_ready(self):
-        xrio_ok = self._xrio_tab.get_signal_count() > 0
-
-        # Compatibilidad con dos modos de la pestaña COMTRADE:
-        # 1) modo clásico (ComtradeConfig)
-        # 2) modo XLSX (sin ComtradeConfig, usa nombres de tablas)
-        comtrade_ok = False
-        cfg = self._comtrade_tab.get_config()
-        if cfg is not None:
-            comtrade_ok = cfg.total_channels > 0
-        else:
-            try:
-                comtrade_ok = len(self._comtrade_tab.get_all_channel_names()) > 0
-            except Exception:
-                comtrade_ok = False
-
-        self._btn_validate.setEnabled(bool(xrio_ok and comtrade_ok))
+        ready = (self._xrio_tab.get_signal_count() > 0
+                 and self._comtrade_tab.is_ready())
+        if ready != self._validate_ready:
+            self._validate_ready = ready
+            self._btn_validate.setEnabled(ready)
 
     # ─── Validación ──────────────────────────────────────────────────
     def _run_validation(self):
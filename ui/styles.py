@@ -1,312 +1,175 @@
 """
 Estilos de la aplicación: Tema corporativo (paleta basada en logo CELSIA/EPM).
+La hoja QSS vive en ui/themes/ y se lee una sola vez por proceso:
+  - base.qss:   reglas estáticas (tabs, tablas, inputs, scrollbars...).
+  - accent.qss: plantilla pequeña con los colores corporativos.
+La base se instala en la QApplication; el acento se aplica sobre la ventana
+principal, de modo que un cambio de colores solo re-parsea el overlay.
 """
-
-APP_THEME = """
-/* ========== BASE ========== */
-QMainWindow, QWidget {
-    background-color: #f3f6f4;
-    color: #1f2937;
-    font-family: "Segoe UI", sans-serif;
-    font-size: 12px;
-}
-
-/* ========== TABS ========== */
-QTabWidget::pane {
-    border: 1px solid #d6e2db;
-    border-radius: 8px;
-    background-color: #ffffff;
-    top: -1px;
-    margin-top: 8px;
-}
-
-QTabWidget::tab-bar {
-    left: 6px;
-}
-
-QTabBar::tab {
-    background-color: #edf3ef;
-    color: #3f4d44;
-    padding: 8px 18px;
-    margin-right: 6px;
-    border: 1px solid #d6e2db;
-    border-radius: 8px;
-    font-weight: 600;
-    min-width: 160px;
-    min-height: 18px;
-}
-
-QTabBar::tab:selected {
-    background-color: #00883A;
-    color: #ffffff;
-    border: 1px solid #00883A;
-}
-
-QTabBar::tab:hover:!selected {
-    background-color: #e4efe7;
-    border-color: #bcd0c2;
-}
-
-QTabBar::tab:!selected {
-    margin-top: 2px;
-}
-
-QTabBar QToolButton {
-    background-color: transparent;
-    border: none;
-}
-
-/* ========== TABLES ========== */
-QTableWidget, QTableView {
-    background-color: #ffffff;
-    alternate-background-color: #f7faf8;
-    gridline-color: #d6e2db;
-    border: 1px solid #d6e2db;
-    selection-background-color: #dcefe0;
-    selection-color: #1f2937;
-    font-size: 11px;
-}
-
-QTableWidget::item, QTableView::item {
-    padding: 2px 5px;
-    border-bottom: 1px solid #e6eee9;
-}
-
-QHeaderView::section {
-    background-color: #e7efe9;
-    color: #3f4d44;
-    padding: 3px 5px;
-    border: none;
-    border-right: 1px solid #d6e2db;
-    border-bottom: 1px solid #bfd0c5;
-    font-weight: 600;
-    font-size: 11px;
-}
-
-/* ========== TREE VIEW ========== */
-QTreeWidget, QTreeView {
-    background-color: #ffffff;
-    alternate-background-color: #f7faf8;
-    border: 1px solid #d6e2db;
-    selection-background-color: #dcefe0;
-    selection-color: #1f2937;
-    outline: none;
-}
-
-QTreeWidget::item, QTreeView::item {
-    padding: 2px 5px;
-}
-
-QTreeWidget::item:selected, QTreeView::item:selected {
-    background-color: #dcefe0;
-}
-
-/* ========== BUTTONS ========== */
-QPushButton {
-    background-color: #f7faf8;
-    color: #1f2937;
-    border: 1px solid #d2ded6;
-    border-radius: 3px;
-    padding: 4px 12px;
-    font-weight: 500;
-    min-height: 22px;
-}
-
-QPushButton:hover {
-    background-color: #edf4ef;
-    border-color: #b6c9bc;
-}
-
-QPushButton:pressed {
-    background-color: #dbe8df;
-}
-
-QPushButton:disabled {
-    color: #9fb1a6;
-}
-
-QPushButton[cssClass="primary"] {
-    background-color: #00883A;
-    color: white;
-    border: none;
-    font-weight: 600;
-}
-QPushButton[cssClass="primary"]:hover {
-    background-color: #007533;
-}
-
-QPushButton[cssClass="success"] {
-    background-color: #5AA61A;
-    color: white;
-    border: none;
-    font-weight: 600;
-}
-QPushButton[cssClass="success"]:hover {
-    background-color: #4f9316;
-}
-
-QPushButton[cssClass="danger"] {
-    background-color: #a64040;
-    color: white;
-    border: none;
-}
-QPushButton[cssClass="danger"]:hover {
-    background-color: #913838;
-}
-
-/* ========== INPUTS ========== */
-QLineEdit, QTextEdit, QPlainTextEdit {
-    background-color: #ffffff;
-    color: #1f2937;
-    border: 1px solid #c8d7cd;
-    border-radius: 3px;
-    padding: 4px 7px;
-    selection-background-color: #dcefe0;
-}
-
-QLineEdit:focus {
-    border-color: #7fbf2a;
-}
-
-QLineEdit::placeholder {
-    color: #95a8a0;
-}
-
-/* ========== COMBO BOX ========== */
-QComboBox {
-    background-color: #ffffff;
-    color: #1f2937;
-    border: 1px solid #c8d7cd;
-    border-radius: 3px;
-    padding: 4px 7px;
-    min-height: 22px;
-}
-
-QComboBox:hover {
-    border-color: #7fbf2a;
-}
-
-QComboBox::drop-down {
-    border: none;
-    width: 22px;
-}
-
-QComboBox QAbstractItemView {
-    background-color: #ffffff;
-    color: #1f2937;
-    border: 1px solid #c8d7cd;
-    selection-background-color: #dcefe0;
-}
-
-/* ========== SCROLL BARS ========== */
-QScrollBar:vertical {
-    background: transparent;
-    width: 7px;
-}
-
-QScrollBar::handle:vertical {
-    background: #b8c8be;
-    border-radius: 3px;
-    min-height: 20px;
-}
-
-QScrollBar::handle:vertical:hover {
-    background: #9eb4a6;
-}
-
-QScrollBar:horizontal {
-    background: transparent;
-    height: 7px;
-}
-
-QScrollBar::handle:horizontal {
-    background: #b8c8be;
-    border-radius: 3px;
-}
-
-QScrollBar::add-line, QScrollBar::sub-line {
-    height: 0; width: 0;
-}
-
-/* ========== SPLITTER ========== */
-QSplitter::handle {
-    background-color: #d6e2db;
-    width: 1px;
-}
-
-/* ========== LABELS ========== */
-QLabel {
-    color: #212529;
-    background: transparent;
-}
-
-QLabel#sectionTitle {
-    font-size: 11px;
-    font-weight: 700;
-    color: #00883A;
-    padding: 1px 0;
-}
-
-QLabel#subtitle {
-    color: #5b6b62;
-    font-size: 11px;
-}
-
-/* ========== GROUP BOX ========== */
-QGroupBox {
-    border: 1px solid #d6e2db;
-    border-radius: 3px;
-    margin-top: 6px;
-    padding: 6px;
-    padding-top: 14px;
-    font-weight: 600;
-    color: #5b6b62;
-    background-color: #ffffff;
-}
-
-QGroupBox::title {
-    subcontrol-origin: margin;
-    subcontrol-position: top left;
-    padding: 0 5px;
-    color: #3f4d44;
-    font-size: 11px;
-}
-
-/* ========== STATUS BAR ========== */
-QStatusBar {
-    background-color: #00883A;
-    color: white;
-    font-size: 11px;
-    padding: 1px 6px;
-    min-height: 18px;
-    max-height: 20px;
-}
-
-QStatusBar::item {
-    border: none;
-}
-
-/* ========== PROGRESS BAR ========== */
-QProgressBar {
-    background-color: #e7efe9;
-    border: none;
-    border-radius: 3px;
-    text-align: center;
-    height: 14px;
-}
-
-QProgressBar::chunk {
-    background-color: #5AA61A;
-    border-radius: 2px;
-}
-
-/* ========== TOOLTIP ========== */
-QToolTip {
-    background-color: #343a40;
-    color: #fff;
-    border: none;
-    border-radius: 3px;
-    padding: 3px 7px;
-    font-size: 11px;
-}
-"""
+import os
+import re
+from functools import lru_cache
+
+THEME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "themes")
+
+# Paleta única: cada color aparece una sola vez y se sustituye al cargar
+PALETTE = {
+    # Acento corporativo
+    "primary": "#00883A",
+    "primary_hover": "#007533",
+    "success": "#5AA61A",
+    "success_hover": "#4f9316",
+    "danger": "#a64040",
+    "danger_hover": "#913838",
+    # Base
+    "bg": "#f3f6f4",
+    "surface": "#ffffff",
+    "alt_row": "#f7faf8",
+    "border": "#d6e2db",
+    "input_border": "#c8d7cd",
+    "focus": "#7fbf2a",
+    "selection": "#dcefe0",
+    "text": "#1f2937",
+    "muted": "#5b6b62",
+    "header_bg": "#e7efe9",
+    "header_text": "#3f4d44",
+    "scroll_handle": "#b8c8be",
+}
+
+# Tooltip: se configura por QPalette (ver init_tooltip_palette), no por QSS
+TOOLTIP_BG = "#343a40"
+TOOLTIP_TEXT = "#ffffff"
+
+ACCENT_PALETTE = {k: PALETTE[k] for k in
+                  ("primary", "primary_hover", "success", "success_hover")}
+
+_RE_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_RE_SPACES = re.compile(r"\s+")
+_RE_PUNCT = re.compile(r"\s*([{};:,])\s*")
+
+_RAW_CACHE: dict[str, str] = {}
+_installed = False
+
+
+def minify_qss(qss: str) -> str:
+    """Quita comentarios y espacios redundantes de una hoja QSS."""
+    qss = _RE_COMMENT.sub("", qss)
+    qss = _RE_SPACES.sub(" ", qss)
+    qss = _RE_PUNCT.sub(r"\1", qss)
+    return qss.strip()
+
+
+def _read_qss(name: str) -> str:
+    """Lee un archivo de ui/themes (cacheado por nombre)."""
+    if name not in _RAW_CACHE:
+        with open(os.path.join(THEME_DIR, name), "r", encoding="utf-8") as f:
+            _RAW_CACHE[name] = f.read()
+    return _RAW_CACHE[name]
+
+
+def _fill(qss: str, palette: dict) -> str:
+    """Sustituye los marcadores @@CLAVE@@ con str.replace (sin parsear formato)."""
+    for key, color in palette.items():
+        qss = qss.replace(f"@@{key.upper()}@@", color)
+    return qss
+
+
+def load_theme_raw() -> str:
+    """Retorna base + acento sin minificar (para depuración)."""
+    return (_fill(_read_qss("base.qss"), PALETTE) + "\n"
+            + _fill(_read_qss("accent.qss"), ACCENT_PALETTE))
+
+
+@lru_cache(maxsize=1)
+def load_base_theme() -> str:
+    """Retorna la hoja base con la paleta aplicada y minificada (una vez)."""
+    return minify_qss(_fill(_read_qss("base.qss"), PALETTE))
+
+
+@lru_cache(maxsize=4)
+def render(primary: str = PALETTE["primary"],
+           primary_hover: str = PALETTE["primary_hover"],
+           success: str = PALETTE["success"],
+           success_hover: str = PALETTE["success_hover"]) -> str:
+    """
+    Overlay de acento minificado para unos colores dados.
+    Cacheado por tupla de colores: alternar entre temas devuelve la misma cadena.
+    """
+    return minify_qss(_fill(_read_qss("accent.qss"), {
+        "primary": primary, "primary_hover": primary_hover,
+        "success": success, "success_hover": success_hover,
+    }))
+
+
+def compose_accent(palette: dict) -> str:
+    """Genera el overlay de acento minificado para una paleta."""
+    return render(**palette)
+
+
+def compose(palette: dict) -> str:
+    """Hoja completa (base + acento) para una paleta."""
+    return load_base_theme() + compose_accent(palette)
+
+
+@lru_cache(maxsize=1)
+def get_theme() -> str:
+    """Retorna la hoja completa minificada con la paleta corporativa."""
+    return compose(ACCENT_PALETTE)
+
+
+def install_theme(app):
+    """
+    Aplica la hoja base una sola vez sobre la QApplication.
+    Los widgets heredan el estilo en cascada; no deben llamar
+    setStyleSheet(APP_THEME) por su cuenta.
+    """
+    global _installed
+    if _installed:
+        return
+    app.setStyleSheet(load_base_theme())
+    _installed = True
+
+
+def init_tooltip_palette():
+    """
+    Colores y fuente de los tooltips vía QPalette, una vez al arrancar.
+    Los tooltips se pulen en cada aparición; sin regla QToolTip en la hoja
+    no pasan por el emparejamiento de selectores QSS.
+    """
+    from PyQt6.QtGui import QColor, QFont, QPalette
+    from PyQt6.QtWidgets import QToolTip
+
+    pal = QToolTip.palette()
+    pal.setColor(QPalette.ColorRole.ToolTipBase, QColor(TOOLTIP_BG))
+    pal.setColor(QPalette.ColorRole.ToolTipText, QColor(TOOLTIP_TEXT))
+    QToolTip.setPalette(pal)
+    QToolTip.setFont(QFont("Segoe UI", 8))
+
+
+def apply_theme_batched(root, qss: str):
+    """
+    Aplica una hoja a un widget ya construido en una sola pasada de estilo.
+    Llamar después de crear todo el árbol de hijos: con las actualizaciones
+    deshabilitadas, ensurePolished() pule raíz e hijos de una vez.
+    """
+    root.setUpdatesEnabled(False)
+    try:
+        root.setStyleSheet(qss)
+        root.ensurePolished()
+    finally:
+        root.setUpdatesEnabled(True)
+
+
+def apply_accent(window, palette: dict = ACCENT_PALETTE):
+    """Aplica (o reemplaza) el overlay de acento sobre una ventana construida."""
+    apply_theme_batched(window, compose_accent(palette))
+
+
+def __getattr__(name: str):
+    # APP_THEME / APP_THEME_RAW se materializan en el primer acceso (PEP 562),
+    # así importar este módulo solo por PALETTE no lee ni arma la hoja QSS.
+    if name == "APP_THEME":
+        return get_theme()
+    if name == "APP_THEME_RAW":
+        return load_theme_raw()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,15 +4,27 @@ Muestra las señales del XRIO organizadas en tablas por bloque
 (AxRADR = analog, BxRBDR = binary) con layout tipo grid.
 """
 import os
-from collections import OrderedDict
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import cycle
+from types import MappingProxyType
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QLabel,
     QPushButton, QLineEdit, QComboBox, QFileDialog, QFrame,
-    QTableWidget, QTableWidgetItem, QHeaderView, QGridLayout,
+    QTableView, QAbstractItemView, QHeaderView, QGridLayout,
     QSizePolicy, QGroupBox, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont, QBrush
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QPoint, QRect, QRectF, QTimer,
+    QThread, QSignalBlocker, QCoreApplication
+)
+from PyQt6.QtGui import (
+    QColor, QFont, QBrush, QPainter, QPainterPath, QPixmap, QPixmapCache
+)
 
 from core.xrio_parser import XRIOParser
 from core.excel_standard_parser import ExcelStandardParser
@@ -34,28 +46,523 @@ _BLOCK_COLORS = [
     ("#00883A", "#ffffff"),
 ]
 
+# Mapa vacío de solo lectura compartido (evita un dict nuevo por widget)
+_EMPTY_MAP = MappingProxyType({})
+
+# ── Estilos de celda compartidos (creados una sola vez, no por fila) ──
+_FONT_BOLD_9 = QFont("Segoe UI", 9, QFont.Weight.Bold)
+_FONT_BOLD_10 = QFont("Segoe UI", 10, QFont.Weight.Bold)
+_BRUSH_GREEN = QBrush(QColor("#00883A"))
+_BRUSH_GREEN_DARK = QBrush(QColor("#198754"))
+_BRUSH_RED = QBrush(QColor("#dc3545"))
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_ALIGN_LEFT_V = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+
+def _fast_upper(text: str) -> str:
+    """upper() que evita la copia cuando el nombre ya viene en mayúsculas (caso usual)."""
+    return text if text.isupper() else text.upper()
+
+
+@lru_cache(maxsize=8)
+def _cached_models(excel_path: str, mtime_ns: int) -> tuple[tuple[str, str], ...]:
+    """
+    Pares (hoja, HOJA) del XLSX con el nombre ya en mayúsculas;
+    se relee solo si cambia la fecha del archivo.
+    """
+    return tuple((m, m.upper())
+                 for m in ExcelStandardParser(excel_path).get_available_models())
+
+
+@lru_cache(maxsize=64)
+def _match_model(excel_path: str, mtime_ns: int, relay_up: str) -> str | None:
+    """Primera hoja cuyo nombre contiene al modelo del relé o está contenida en él."""
+    return next((m for m, mu in _cached_models(excel_path, mtime_ns)
+                 if mu in relay_up or relay_up in mu), None)
+
+
+# (ruta, mtime_ns, hoja) ya parseadas o encoladas para precarga
+_SHEETS_SEEN: set[tuple[str, int, str]] = set()
+
+
+@lru_cache(maxsize=64)
+def _cached_sheet(excel_path: str, mtime_ns: int, sheet_name: str) -> dict:
+    """
+    Bloques de una hoja del estándar, parseados una vez por fecha del archivo.
+    Cada fila trae además 'name_key' (nombre sin espacios, en mayúsculas e
+    internado), la clave de los mapas de búsqueda.
+    Uso de solo lectura: el dict se comparte entre llamadas.
+    """
+    _SHEETS_SEEN.add((excel_path, mtime_ns, sheet_name))
+    blocks = ExcelStandardParser(excel_path).parse_sheet(sheet_name)
+    for rows in blocks.values():
+        for row in rows:
+            row['name_key'] = sys.intern(_fast_upper((row.get('name') or '').strip()))
+    return blocks
+
+
+@lru_cache(maxsize=8)
+def _cached_std_map(excel_path: str, mtime_ns: int,
+                    relay_model_norm: str) -> tuple[tuple[str, str], ...]:
+    """
+    Pares (NOMBRE_SEÑAL, Start Std) del estándar para un modelo de relé.
+    La clave incluye mtime_ns: editar el XLSX invalida la entrada.
+    """
+    best_match = _match_model(excel_path, mtime_ns, relay_model_norm)
+    if not best_match:
+        return ()
+
+    pairs: dict[str, str] = {}
+    standard_data = _cached_sheet(excel_path, mtime_ns, best_match)
+    for _, rows in standard_data.items():
+        for row in rows:
+            if not row['name_key']:
+                continue
+            # La primera aparición gana
+            pairs.setdefault(row['name_key'], (row.get('group') or '').strip())
+    return tuple(pairs.items())
+
+
+_SHEET_POOL: ThreadPoolExecutor | None = None
+_SHEET_POOL_CLOSED = False
+
+
+def _prewarm_sheets(excel_path: str, mtime_ns: int):
+    """
+    Encola el parseo del resto de hojas en _cached_sheet (hasta 4 a la vez),
+    así cambiar de modelo de relé no vuelve a leer el XLSX en la UI.
+    Solo se encolan hojas no parseadas ni encoladas antes.
+    """
+    global _SHEET_POOL
+    if _SHEET_POOL_CLOSED:
+        return
+    if _SHEET_POOL is None:
+        _SHEET_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="xlsx-sheet")
+    for sheet, _ in _cached_models(excel_path, mtime_ns):
+        key = (excel_path, mtime_ns, sheet)
+        if key in _SHEETS_SEEN:
+            continue
+        _SHEETS_SEEN.add(key)
+        try:
+            _SHEET_POOL.submit(_cached_sheet, *key)
+        except RuntimeError:
+            return  # el pool se cerró mientras se encolaba (salida de la app)
 
-class DisturbanceReportBlockTable(QFrame):
-    """Widget para UN bloque BxRBDR específico."""
 
-    def __init__(self, block_name: str, signals: list, std_start_map: dict | None = None, parent=None):
+def _shutdown_sheet_pool():
+    """Al salir, descarta las hojas encoladas sin esperar a que se parseen."""
+    global _SHEET_POOL_CLOSED
+    _SHEET_POOL_CLOSED = True
+    if _SHEET_POOL is not None:
+        _SHEET_POOL.shutdown(wait=False, cancel_futures=True)
+
+
+class _StdMapLoader(QThread):
+    """Construye el std_start_map (parseo del XLSX) fuera del hilo de la UI."""
+
+    ready = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+    def __init__(self, excel_path: str, relay_model: str, parent=None):
+        super().__init__(parent)
+        self._excel_path = excel_path
+        self._relay_model = relay_model
+
+    def run(self):
+        try:
+            mtime_ns = os.stat(self._excel_path).st_mtime_ns
+            self.ready.emit(dict(_cached_std_map(
+                self._excel_path, mtime_ns, self._relay_model.upper())))
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        # La hoja del relé ya está lista; el resto se precarga sin apuro
+        _prewarm_sheets(self._excel_path, mtime_ns)
+
+
+# Cargadores en curso. Sin padre (destruir la pestaña no destruye un QThread
+# en marcha); la referencia vive aquí hasta que terminan
+_LIVE_LOADERS: set[_StdMapLoader] = set()
+
+
+def _wait_std_loaders():
+    """Al salir de la aplicación, espera a los cargadores que sigan corriendo."""
+    for loader in list(_LIVE_LOADERS):
+        loader.wait()
+
+
+def _normalize_names(signals: list):
+    """
+    Precalcula una vez por carga la clave de búsqueda en std_start_map
+    (nombre sin espacios y en mayúsculas) de cada señal: sig._norm_name.
+    """
+    for sig in signals:
+        sig._norm_name = sys.intern(_fast_upper((sig.name or "").strip()))
+
+
+def _cell(text: str, brush=None, font=None, tooltip=None) -> tuple:
+    """Celda precalculada: (texto, foreground, fuente, tooltip)."""
+    return (text, brush, font, tooltip)
+
+
+# Celdas constantes compartidas por todas las filas (tuplas inmutables)
+_EMPTY_CELL = _cell("")
+_DASH_CELL = _cell("-")
+_CHECK_CELL = _cell("✔", _BRUSH_GREEN)
+_CHECK_CELL_DARK = _cell("✔", _BRUSH_GREEN_DARK)
+_ON_CELL = _cell("On", _BRUSH_GREEN, _FONT_BOLD_9)
+_OFF_CELL = _cell("Off")
+
+# Celdas sin estilo de alfabeto pequeño (estado, fase, unidad, Start Std):
+# una sola tupla por texto distinto, reutilizada entre filas y bloques
+_CELL_CACHE: dict[str, tuple] = {}
+
+
+def _shared_cell(text: str) -> tuple:
+    cell = _CELL_CACHE.get(text)
+    if cell is None:
+        cell = _CELL_CACHE[text] = _cell(text)
+    return cell
+
+
+def _dr_row(sig: DisturbanceReportSignal, std_start_map: dict) -> tuple:
+    sig_name = (sig.name or "").strip()
+    std_start = std_start_map.get(sig._norm_name, "")
+    trig_on = "On" in sig.trig_operation
+    return (
+        # V (Vacío hasta validar)
+        _CHECK_CELL if std_start else _EMPTY_CELL,
+        # Señal (Name), descripción como tooltip
+        _cell(sig_name,
+              font=_FONT_BOLD_9 if trig_on else None,
+              tooltip=sig.description),
+        # Start XRIO (Trig Oper)
+        _cell(sig.trig_operation,
+              _BRUSH_GREEN if trig_on else None,
+              _FONT_BOLD_9 if trig_on else None),
+        # Start Std desde XLSX si coincide
+        _shared_cell(std_start) if std_start else _DASH_CELL,
+    )
+
+
+def _analog_row(sig: AnalogSignal, std_start_map: dict) -> tuple:
+    sig_name = (sig.name or "").strip()
+    std_start = std_start_map.get(sig._norm_name, "")
+    return (
+        _CHECK_CELL if std_start else _EMPTY_CELL,
+        _cell(sig_name, tooltip=sig_name),
+        _shared_cell(sig.status),
+        _shared_cell(std_start) if std_start else _DASH_CELL,
+        _shared_cell(sig.phase),
+        _shared_cell(sig.unit),
+        _cell(f"{sig.primary:g}"),
+    )
+
+
+def _binary_row(sig: BinarySignal, std_start_map: dict) -> tuple:
+    sig_name = (sig.name or "").strip()
+    std_start = std_start_map.get(sig._norm_name, "")
+    return (
+        _CHECK_CELL if std_start else _EMPTY_CELL,
+        _cell(sig_name),
+        # Start XRIO desde estado binario
+        _ON_CELL if sig.state == 1 else _OFF_CELL,
+        _shared_cell(std_start) if std_start else _DASH_CELL,
+    )
+
+
+def _comparison_row(sig: dict, xrio_signals_map: dict) -> tuple:
+    std_name = sig['name']
+    # Buscar en mapa XRIO (clave precalculada en _cached_sheet)
+    xrio_sig = xrio_signals_map.get(sig['name_key'])
+    exists = xrio_sig is not None
+    xrio_start_val = ""
+    if exists and hasattr(xrio_sig, 'trig_operation'):
+        xrio_start_val = xrio_sig.trig_operation
+    start_on = "On" in xrio_start_val
+    return (
+        _CHECK_CELL_DARK if exists else _EMPTY_CELL,
+        _cell(std_name, None if exists else _BRUSH_RED),
+        (_cell(xrio_start_val,
+               _BRUSH_GREEN_DARK if start_on else None,
+               _FONT_BOLD_9 if start_on else None)
+         if xrio_start_val else _DASH_CELL),
+        _shared_cell(sig['group']),
+    )
+
+
+def _block_row_builder(signal_type: str):
+    """Constructor de filas de un BlockTable según el tipo de señal."""
+    return _analog_row if signal_type == "analog" else _binary_row
+
+
+class SignalTableModel(QAbstractTableModel):
+    """
+    Modelo de solo lectura para las tablas por bloque.
+    Guarda la lista de señales tal cual; cada fila se arma con
+    row_builder(señal, lookup) en el primer acceso y queda cacheada.
+    """
+
+    def __init__(self, signals: list, columns, row_builder, lookup: dict | None = None,
+                 parent=None):
         super().__init__(parent)
-        self._block_name = block_name
         self._signals = signals
-        self._std_start_map = std_start_map or {}
-        self._setup_ui()
+        self._columns = tuple(columns)
+        self._row_builder = row_builder
+        # std_start_map (o mapa de señales XRIO en la comparación)
+        self._lookup = lookup if lookup is not None else _EMPTY_MAP
+        self._row_cache: list[tuple | None] = [None] * len(signals)
+        # Texto de todas las celdas en mayúsculas, armado en el primer filtro
+        self._search_blob: str | None = None
+
+    def _row(self, row: int) -> tuple:
+        cells = self._row_cache[row]
+        if cells is None:
+            cells = self._row_builder(self._signals[row], self._lookup)
+            self._row_cache[row] = cells
+        return cells
+
+    def set_lookup(self, lookup: dict):
+        """
+        Cambia el mapa de búsqueda y repinta solo V..Start Std (columnas 0-3),
+        sin reset: las filas se rearman en el próximo acceso.
+        """
+        self._lookup = lookup
+        self._row_cache = [None] * len(self._signals)
+        self._search_blob = None
+        if self._signals:
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(len(self._signals) - 1, 3))
+
+    def clear(self):
+        """Suelta las señales y filas cacheadas (antes de descartar la tabla)."""
+        self.beginResetModel()
+        self._signals = []
+        self._row_cache = []
+        self._search_blob = None
+        self.endResetModel()
+
+    def matches(self, text: str) -> bool:
+        """True si alguna celda contiene text (ya en mayúsculas)."""
+        if self._search_blob is None:
+            self._search_blob = "\n".join(
+                cell[0] for row in range(len(self._signals))
+                for cell in self._row(row)).upper()
+        return text in self._search_blob
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._signals)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole):
+            return self._columns[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            # Alinear izquierda solo la Señal (1)
+            return _ALIGN_LEFT_V if col == 1 else _ALIGN_CENTER
+
+        cell = self._row(index.row())[col]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return cell[0]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return cell[1]
+        if role == Qt.ItemDataRole.FontRole:
+            return cell[2]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return cell[3]
+        return None
+
+
+class BlockHeader(QWidget):
+    """
+    Cabecera coloreada de un bloque, sin hoja de estilo propia.
+    La barra de fondo (esquinas superiores redondeadas) se pinta una vez por
+    color y ancho en un QPixmap cacheado en QPixmapCache; encima va el texto.
+    """
+
+    HEIGHT = 24
+
+    def __init__(self, text: str, color_bg: str, color_fg: str,
+                 align=Qt.AlignmentFlag.AlignCenter, parent=None):
+        super().__init__(parent)
+        self._text = text
+        self._color_bg = color_bg
+        self._color_fg = QColor(color_fg)
+        self._align = align | Qt.AlignmentFlag.AlignVCenter
+        self.setFixedHeight(self.HEIGHT)
+
+    def _background(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        key = f"block_header:{self._color_bg}:{self.width()}:{dpr}"
+        pix = QPixmapCache.find(key)
+        if pix is not None:
+            return pix
+        pix = QPixmap(int(self.width() * dpr), int(self.HEIGHT * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pix)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Se extiende el rectángulo hacia abajo para que solo redondee arriba
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(0, 0, self.width(), self.HEIGHT + 4), 3, 3)
+        painter.fillPath(path, QColor(self._color_bg))
+        painter.end()
+        QPixmapCache.insert(key, pix)
+        return pix
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background())
+        painter.setPen(self._color_fg)
+        painter.setFont(_FONT_BOLD_10)
+        painter.drawText(self.rect().adjusted(8, 0, -8, 0), self._align, self._text)
+        painter.end()
+
+
+@dataclass(frozen=True)
+class _ColSpec:
+    """Columna de una tabla de bloque: título y ancho fijo (None = Stretch)."""
+    title: str
+    width: int | None = None
+
+
+_DR_COLUMNS = (_ColSpec("V", 30), _ColSpec("Señal"),
+               _ColSpec("Start XRIO", 90), _ColSpec("Start Std", 90))
+_ANALOG_COLUMNS = (_ColSpec("V", 32), _ColSpec("Señal"),
+                   _ColSpec("Start XRIO", 95), _ColSpec("Start Std", 90),
+                   _ColSpec("Fase", 60), _ColSpec("Unidad", 80), _ColSpec("Prim", 95))
+_BINARY_COLUMNS = (_ColSpec("V", 28), _ColSpec("Señal"),
+                   _ColSpec("Start XRIO", 95), _ColSpec("Start Std", 95))
+_COMPARISON_COLUMNS = (_ColSpec("V", 28), _ColSpec("Señal"),
+                       _ColSpec("Start XRIO", 90), _ColSpec("Start Std", 90))
+
+
+class _BaseBlockTable(QFrame):
+    """
+    Marco + cabecera coloreada + QTableView sobre SignalTableModel.
+    Las subclases solo aportan columnas, constructor de filas y los
+    atributos de clase que difieren entre variantes.
+    """
+
+    TABLE_NAME = "blockTable"       # objectName (estilo en base.qss)
+    ROW_HEIGHT = 24
+    MAX_VISIBLE_ROWS: int | None = None  # None = sin altura mínima
+    SINGLE_SELECTION = False
+    PIXEL_SCROLL = True
+    SIZE_POLICY = QSizePolicy.Policy.Expanding
+
+    def _setup_block(self, header_text: str, color_bg: str, color_fg: str,
+                     columns: tuple, signals: list, row_builder, lookup,
+                     header_align=Qt.AlignmentFlag.AlignCenter):
+        # Claves del filtro, calculadas una vez por bloque
+        self.block_name_upper = self._block_name.upper()
+        self.is_analog = "RADR" in self.block_name_upper
 
-    def _setup_ui(self):
         self.setFrameShape(QFrame.Shape.Box)
-        self.setStyleSheet(
-            "DisturbanceReportBlockTable { border: 1px solid #dee2e6; border-radius: 4px; "
-            "background-color: #ffffff; }")
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setSizePolicy(self.SIZE_POLICY, self.SIZE_POLICY)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
+        # ── Header del bloque ──
+        layout.addWidget(BlockHeader(header_text, color_bg, color_fg, header_align))
+
+        # ── Tabla ──
+        table = QTableView()
+        table.setObjectName(self.TABLE_NAME)
+        table.setProperty("alternating", "true")
+        table.setAlternatingRowColors(True)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        if self.SINGLE_SELECTION:
+            table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        if self.PIXEL_SCROLL:
+            table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+            table.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        table.verticalHeader().setVisible(False)
+        table.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        table.setShowGrid(True)
+
+        self._model = SignalTableModel(
+            signals, tuple(c.title for c in columns), row_builder, lookup, self)
+        table.setModel(self._model)
+
+        # Anchos fijos por columna; la de ancho None (Señal) ocupa el resto
+        header = table.horizontalHeader()
+        for col, spec in enumerate(columns):
+            if spec.width is None:
+                header.setSectionResizeMode(col, QHeaderView.ResizeMode.Stretch)
+            else:
+                header.setSectionResizeMode(col, QHeaderView.ResizeMode.Fixed)
+                table.setColumnWidth(col, spec.width)
+
+        # Ajuste de altura dinámica
+        table_height = self.table_height(len(signals))
+        if table_height is not None:
+            table.setMinimumHeight(table_height)
+            self.setMinimumHeight(self.block_height(len(signals)))
+
+        layout.addWidget(table)
+        self._table = table
+
+    @classmethod
+    def table_height(cls, n_rows: int) -> int | None:
+        """Altura mínima de la tabla para n_rows filas (None = sin mínimo)."""
+        if cls.MAX_VISIBLE_ROWS is None:
+            return None
+        visible_rows = max(6, min(n_rows, cls.MAX_VISIBLE_ROWS))
+        return 34 + (visible_rows * cls.ROW_HEIGHT)
+
+    @classmethod
+    def block_height(cls, n_rows: int) -> int | None:
+        """Altura mínima del bloque completo (cabecera + tabla)."""
+        table_height = cls.table_height(n_rows)
+        # Cabecera del bloque + 4 px de marco
+        return None if table_height is None else table_height + BlockHeader.HEIGHT + 4
+
+    def update_std_column(self, std_start_map: dict):
+        """Aplica un nuevo std_start_map reescribiendo solo V y Start Std."""
+        self._std_start_map = std_start_map
+        self._model.set_lookup(std_start_map)
+
+    def matches(self, text: str) -> bool:
+        return self._model.matches(text)
+
+    @property
+    def block_name(self) -> str:
+        return self._block_name
+
+    @property
+    def signal_count(self) -> int:
+        return self._model.rowCount()
+
+
+class DisturbanceReportBlockTable(_BaseBlockTable):
+    """Widget para UN bloque BxRBDR específico."""
+
+    TABLE_NAME = "drBlockTable"
+    MAX_VISIBLE_ROWS = 10
+
+    def __init__(self, block_name: str, signals: list, std_start_map: dict | None = None, parent=None):
+        super().__init__(parent)
+        self._block_name = block_name
+        self._signals = signals
+        self._std_start_map = std_start_map if std_start_map is not None else _EMPTY_MAP
+        self._setup_ui()
+
+    def _setup_ui(self):
         # Determinar color basado en el bloque (similar a la lógica anterior)
         # B1 = Azul, B2 = Verde, etc.
         color_idx = 7 # Default indigo
@@ -67,100 +574,11 @@ class DisturbanceReportBlockTable(QFrame):
         
         bg_col, fg_col = _BLOCK_COLORS[color_idx]
 
-        # ── Header ──
-        header_text = f"  {self._block_name} ({len(self._signals)} Señales)"
-        header = QLabel(header_text)
-        header.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        header.setFixedHeight(24) # Reducido de 28
-        header.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        header.setStyleSheet(
-            f"background-color: {bg_col}; color: {fg_col}; " 
-            "border-top-left-radius: 3px; border-top-right-radius: 3px; "
-            "padding-left: 8px;")
-        layout.addWidget(header)
-
-        # ── Tabla ──
-        table = QTableWidget()
-        table.setAlternatingRowColors(True)
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        table.setVerticalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        table.setHorizontalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        table.verticalHeader().setVisible(False)
-        table.verticalHeader().setDefaultSectionSize(24)
-        table.setShowGrid(True)
-        
-        # Estilo optimizado (más compacto)
-        table.setStyleSheet(
-            "QTableWidget { border: none; font-size: 11px; }" # Reducido de 12px
-            "QHeaderView::section { font-size: 11px; font-weight: bold; padding: 2px 4px; background-color: #f8f9fa; border: 1px solid #dee2e6; }"
-            "QTableWidget::item { padding-left: 4px; padding-right: 4px; }"
-        )
-
         # Columnas solicitadas: V, Señal, Start XRIO, Start Std
-        cols = ["V", "Señal", "Start XRIO", "Start Std"]
-        table.setColumnCount(len(cols))
-        table.setHorizontalHeaderLabels(cols)
-        table.setRowCount(len(self._signals))
-
-        # Configurar anchos optimizados
-        header_view = table.horizontalHeader()
-        
-        # V
-        header_view.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-        table.setColumnWidth(0, 30)
-        
-        # Señal - Stretch para ocupar espacio
-        header_view.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-
-        # Start XRIO
-        header_view.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
-        table.setColumnWidth(2, 90)
-
-        # Start Std
-        header_view.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
-        table.setColumnWidth(3, 90)
-
-        for r, sig in enumerate(self._signals):
-            sig_name = (sig.name or "").strip()
-            std_start = self._std_start_map.get(sig_name.upper(), "")
-            is_valid = bool(std_start)
-
-            # V (Vacío hasta validar)
-            item_v = QTableWidgetItem("✔" if is_valid else "")
-            item_v.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if is_valid:
-                item_v.setForeground(QBrush(QColor("#00883A")))
-            table.setItem(r, 0, item_v)
-
-            # Señal (Name)
-            item_name = QTableWidgetItem(sig_name)
-            item_name.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            item_name.setToolTip(sig.description) # Descripción como tooltip
-            if "On" in sig.trig_operation:
-                 item_name.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-            table.setItem(r, 1, item_name)
-
-            # Start XRIO (Trig Oper)
-            item_trig = QTableWidgetItem(sig.trig_operation)
-            item_trig.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if "On" in sig.trig_operation:
-                item_trig.setForeground(QBrush(QColor("#00883A")))
-                item_trig.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-            table.setItem(r, 2, item_trig)
-
-            # Start Std desde XLSX si coincide
-            item_std = QTableWidgetItem(std_start if std_start else "-")
-            item_std.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            table.setItem(r, 3, item_std)
-
-        # Ajuste de altura dinámica
-        visible_rows = max(6, min(len(self._signals), 10))
-        table_height = 34 + (visible_rows * 24)
-        table.setMinimumHeight(table_height)
-        self.setMinimumHeight(table_height + 28)
-
-        layout.addWidget(table)
+        self._setup_block(
+            f"  {self._block_name} ({len(self._signals)} Señales)", bg_col, fg_col,
+            _DR_COLUMNS, self._signals, _dr_row, self._std_start_map,
+            Qt.AlignmentFlag.AlignLeft)
 
 
 class DisturbanceReportContainer(QWidget):
@@ -169,10 +587,12 @@ class DisturbanceReportContainer(QWidget):
     def __init__(self, signals: list, std_start_map: dict | None = None, parent=None):
         super().__init__(parent)
         self._signals = signals
-        self._std_start_map = std_start_map or {}
+        self._std_start_map = std_start_map if std_start_map is not None else _EMPTY_MAP
+        _normalize_names(self._signals)
         self._setup_ui()
     
     def _setup_ui(self):
+        self._tables: list[DisturbanceReportBlockTable] = []
         layout = QGridLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(6)
@@ -180,17 +600,13 @@ class DisturbanceReportContainer(QWidget):
         layout.setColumnStretch(0, 1)
         layout.setColumnStretch(1, 1)
 
-        # Agrupar señales por bloque
-        # Usamos OrderedDict para mantener orden de aparición (o orden alfabético)
-        blocks_map = OrderedDict()
-        
-        # Primero ordenamos las señales por bloque para que aparezcan ordenados B1, B2...
-        sorted_signals = sorted(self._signals, key=lambda s: (s.block, s.channel))
-
-        for sig in sorted_signals:
-            if sig.block not in blocks_map:
-                blocks_map[sig.block] = []
+        # Agrupar señales por bloque en una sola pasada; luego se ordena
+        # cada bloque por canal (listas pequeñas) y los bloques por nombre B1, B2...
+        blocks_map: defaultdict[str, list] = defaultdict(list)
+        for sig in self._signals:
             blocks_map[sig.block].append(sig)
+        for block_signals in blocks_map.values():
+            block_signals.sort(key=lambda s: s.channel)
         
         if not blocks_map:
              lbl = QLabel("No Disturbance Report Configuration found.")
@@ -200,14 +616,20 @@ class DisturbanceReportContainer(QWidget):
         row = 0
         col = 0
         max_cols = 2
-        for block_name, block_signals in blocks_map.items():
+        for block_name, block_signals in sorted(blocks_map.items()):
             table_widget = DisturbanceReportBlockTable(block_name, block_signals, self._std_start_map)
+            self._tables.append(table_widget)
             layout.addWidget(table_widget, row, col)
             col += 1
             if col >= max_cols:
                 col = 0
                 row += 1
 
+    def update_std_column(self, std_start_map: dict):
+        self._std_start_map = std_start_map
+        for table in self._tables:
+            table.update_std_column(std_start_map)
+
 
 class DisturbanceReportTable(DisturbanceReportContainer):
     """Wrapper para mantener compatibilidad con codigo existente si es necesario,
@@ -215,9 +637,12 @@ class DisturbanceReportTable(DisturbanceReportContainer):
     pass
 
 
-class BlockTable(QFrame):
+class BlockTable(_BaseBlockTable):
     """Widget que representa un solo bloque (AxRADR / BxRBDR) como tabla compacta."""
 
+    MAX_VISIBLE_ROWS = 12
+    SINGLE_SELECTION = True
+
     def __init__(self, block_name: str, signals: list, signal_type: str,
                  color_bg: str, color_fg: str, std_start_map: dict | None = None,
                  parent=None):
@@ -225,174 +650,86 @@ class BlockTable(QFrame):
         self._block_name = block_name
         self._signals = signals
         self._signal_type = signal_type
-        self._std_start_map = std_start_map or {}
-        self._setup_ui(color_bg, color_fg)
+        self._std_start_map = std_start_map if std_start_map is not None else _EMPTY_MAP
+        # Columnas validadas contra estándar XLSX
+        columns = _ANALOG_COLUMNS if signal_type == "analog" else _BINARY_COLUMNS
+        self._setup_block(
+            f"  {block_name}  ({len(signals)})", color_bg, color_fg,
+            columns, signals, _block_row_builder(signal_type), self._std_start_map)
 
-    def _setup_ui(self, color_bg: str, color_fg: str):
-        self.setFrameShape(QFrame.Shape.Box)
-        self.setStyleSheet(
-            "BlockTable { border: 1px solid #dee2e6; border-radius: 4px; "
-            "background-color: #ffffff; }")
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
+class ComparisonBlockTable(_BaseBlockTable):
+    """Tabla que representa un bloque del estándar con estado de validación."""
 
-        # ── Header del bloque ──
-        header = QLabel(f"  {self._block_name}  ({len(self._signals)})")
-        header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header.setFixedHeight(24)
-        header.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        header.setStyleSheet(
-            f"background-color: {color_bg}; color: {color_fg}; "
-            f"border-top-left-radius: 3px; border-top-right-radius: 3px; "
-            f"padding: 2px 6px;")
-        layout.addWidget(header)
+    TABLE_NAME = "comparisonBlockTable"
+    ROW_HEIGHT = 20
+    MAX_VISIBLE_ROWS = 10
+    PIXEL_SCROLL = False
+    SIZE_POLICY = QSizePolicy.Policy.Preferred
 
-        # ── Tabla ──
-        table = QTableWidget()
-        table.setAlternatingRowColors(True)
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        table.setVerticalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        table.setHorizontalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        table.verticalHeader().setVisible(False)
-        table.verticalHeader().setDefaultSectionSize(24)
-        table.setShowGrid(True)
-        table.setStyleSheet(
-            "QTableWidget { border: none; font-size: 11px; }"
-            "QHeaderView::section { font-size: 10px; padding: 4px 6px; }")
+    def __init__(self, block_name: str, standard_signals: list, xrio_signals_map: dict,
+                 color_bg: str, color_fg: str, parent=None):
+        super().__init__(parent)
+        self._block_name = block_name
+        self._standard_signals = standard_signals
+        self._xrio_signals_map = xrio_signals_map
+        # Columnas solicitadas: V, Señal, Arranca XRIO, Arranca Estándar
+        self._setup_block(
+            f"  {block_name}  ", color_bg, color_fg,
+            _COMPARISON_COLUMNS, standard_signals, _comparison_row, xrio_signals_map)
 
-        if self._signal_type == "analog":
-            self._build_analog_table(table)
-        else:
-            self._build_binary_table(table)
 
-        visible_rows = max(6, min(len(self._signals), 12))
-        table_height = 34 + (visible_rows * 24)
-        table.setMinimumHeight(table_height)
-        self.setMinimumHeight(table_height + 28)
+class _LazyBlock(QFrame):
+    """
+    Reserva el lugar de una tabla de bloque (TARGET) en el grid sin construirla.
+    Muestra solo la cabecera y ocupa la altura mínima que tendrá la tabla real;
+    XRIOTab lo reemplaza por build() cuando entra al área visible.
+    """
 
-        # table.horizontalHeader().setStretchLastSection(True) # Reemplazado por modos específicos
-        layout.addWidget(table)
-        self._table = table
+    TARGET: type[_BaseBlockTable]
 
-    def _build_analog_table(self, table: QTableWidget):
-        # Columnas analógicas validadas contra estándar XLSX
-        cols = ["V", "Señal", "Start XRIO", "Start Std", "Fase", "Unidad", "Prim"]
-        table.setColumnCount(len(cols))
-        table.setHorizontalHeaderLabels(cols)
-        table.setRowCount(len(self._signals))
-        table.verticalHeader().setDefaultSectionSize(24)
+    def __init__(self, target_args: tuple, block_name: str, signals: list,
+                 header_text: str, color_bg: str, color_fg: str,
+                 row_builder, lookup: dict | None, parent=None):
+        super().__init__(parent)
+        self._args = target_args
+        self._block_name = block_name
+        self._signals = signals
+        self._row_builder = row_builder
+        self._lookup = lookup
+        self.block_name_upper = block_name.upper()
+        self.is_analog = "RADR" in self.block_name_upper
+        self._search_blob: str | None = None
 
-        # Modos de redimensionamiento
-        header = table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)            # V
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)          # Señal
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)            # Start XRIO
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)            # Start Std
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)            # Fase
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)            # Unidad
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Fixed)            # Prim
-        
-        # Anchos iniciales
-        table.setColumnWidth(0, 32)
-        table.setColumnWidth(2, 95)
-        table.setColumnWidth(3, 90)
-        table.setColumnWidth(4, 60)
-        table.setColumnWidth(5, 80)
-        table.setColumnWidth(6, 95)
-
-        for r, sig in enumerate(self._signals):
-            sig_name = (sig.name or "").strip()
-            std_start = self._std_start_map.get(sig_name.upper(), "")
-            is_valid = bool(std_start)
-
-            # V validación por coincidencia contra XLSX
-            item_v = QTableWidgetItem("✔" if is_valid else "")
-            item_v.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if is_valid:
-                item_v.setForeground(QBrush(QColor("#00883A")))
-            table.setItem(r, 0, item_v)
-
-            status = sig.status if hasattr(sig, 'status') else "On"
-
-            items = [
-                # Column 1: Señal
-                sig_name,
-                # Column 2: Start XRIO
-                status,
-                # Column 3: Start Std (desde XLSX)
-                std_start if std_start else "-",
-                # Column 4: Fase
-                sig.phase,
-                # Column 5: Unidad
-                sig.unit,
-                # Column 6: Prim
-                f"{sig.primary:g}",
-            ]
-            
-            for i, txt in enumerate(items):
-                col_idx = i + 1
-                it = QTableWidgetItem(txt)
-                # Alinear izquierda solo Nombre (1)
-                align = (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter 
-                         if col_idx == 1 else Qt.AlignmentFlag.AlignCenter)
-                it.setTextAlignment(align)
-                if col_idx == 1:
-                    it.setToolTip(txt)
-                table.setItem(r, col_idx, it)
-
-    def _build_binary_table(self, table: QTableWidget):
-        cols = ["V", "Señal", "Start XRIO", "Start Std"]
-        table.setColumnCount(len(cols))
-        table.setHorizontalHeaderLabels(cols)
-        table.setRowCount(len(self._signals))
-        
-        # Modos de redimensionamiento
-        header = table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)            # V
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)          # Señal
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)            # Start XRIO
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)            # Start Std
-
-        table.setColumnWidth(0, 28)
-        table.setColumnWidth(2, 95)
-        table.setColumnWidth(3, 95)
-
-        for r, sig in enumerate(self._signals):
-            sig_name = (sig.name or "").strip()
-            std_start = self._std_start_map.get(sig_name.upper(), "")
-            is_valid = bool(std_start)
-
-            # V validación por coincidencia contra XLSX
-            chk = QTableWidgetItem("✔" if is_valid else "")
-            chk.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if is_valid:
-                chk.setForeground(QBrush(QColor("#00883A")))
-            table.setItem(r, 0, chk)
-
-            # Nombre
-            name_it = QTableWidgetItem(sig_name)
-            name_it.setTextAlignment(
-                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            table.setItem(r, 1, name_it)
-
-            # Start XRIO desde estado binario
-            start_xrio = "On" if getattr(sig, 'state', 0) == 1 else "Off"
-            xrio_it = QTableWidgetItem(start_xrio)
-            xrio_it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if start_xrio == "On":
-                xrio_it.setForeground(QBrush(QColor("#00883A")))
-                xrio_it.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-            table.setItem(r, 2, xrio_it)
-
-            # Start Std
-            std_it = QTableWidgetItem(std_start if std_start else "-")
-            std_it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            table.setItem(r, 3, std_it)
+        self.setFrameShape(QFrame.Shape.Box)
+        self.setSizePolicy(self.TARGET.SIZE_POLICY, self.TARGET.SIZE_POLICY)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(BlockHeader(header_text, color_bg, color_fg))
+        layout.addStretch(1)
+
+        # Misma altura mínima que la tabla real para que el scroll no salte
+        height = self.TARGET.block_height(len(signals))
+        if height is not None:
+            self.setMinimumHeight(height)
+
+    def build(self) -> _BaseBlockTable:
+        """Construye la tabla real con los mismos argumentos."""
+        return self.TARGET(*self._args)
+
+    def update_std_column(self, std_start_map: dict):
+        pass
+
+    def matches(self, text: str) -> bool:
+        """Busca en los textos de las filas sin construir la tabla."""
+        if self._search_blob is None:
+            lookup = self._lookup if self._lookup is not None else _EMPTY_MAP
+            self._search_blob = "\n".join(
+                cell[0] for sig in self._signals
+                for cell in self._row_builder(sig, lookup)).upper()
+        return text in self._search_blob
 
     @property
     def block_name(self) -> str:
@@ -403,117 +740,39 @@ class BlockTable(QFrame):
         return len(self._signals)
 
 
-class ComparisonBlockTable(QFrame):
-    """Tabla que representa un bloque del estándar con estado de validación."""
-    def __init__(self, block_name: str, standard_signals: list, xrio_signals_map: dict,
-                 color_bg: str, color_fg: str, parent=None):
-        super().__init__(parent)
-        self._block_name = block_name
-        self._standard_signals = standard_signals
-        self._xrio_signals_map = xrio_signals_map
-        self._setup_ui(color_bg, color_fg)
+class LazyBlockPlaceholder(_LazyBlock):
+    """Placeholder de un BlockTable (bloque AxRADR / BxRBDR del XRIO)."""
 
-    def _setup_ui(self, color_bg: str, color_fg: str):
-        self.setFrameShape(QFrame.Shape.Box)
-        self.setStyleSheet(
-            "ComparisonBlockTable { border: 1px solid #dee2e6; border-radius: 4px; "
-            "background-color: #ffffff; }")
-        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+    TARGET = BlockTable
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
+    def __init__(self, block_name: str, signals: list, signal_type: str,
+                 color_bg: str, color_fg: str, std_start_map: dict | None = None,
+                 parent=None):
+        super().__init__(
+            (block_name, signals, signal_type, color_bg, color_fg, std_start_map),
+            block_name, signals, f"  {block_name}  ({len(signals)})",
+            color_bg, color_fg, _block_row_builder(signal_type), std_start_map, parent)
 
-        # Header del bloque
-        header = QLabel(f"  {self._block_name}  ")
-        header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header.setFixedHeight(24)
-        header.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        header.setStyleSheet(
-            f"background-color: {color_bg}; color: {color_fg}; "
-            f"border-top-left-radius: 3px; border-top-right-radius: 3px; "
-            f"padding: 2px 6px;")
-        layout.addWidget(header)
-
-        # Tabla
-        table = QTableWidget()
-        table.setAlternatingRowColors(True)
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        table.verticalHeader().setVisible(False)
-        table.verticalHeader().setDefaultSectionSize(20)
-        table.setShowGrid(True)
-        table.setStyleSheet(
-            "QTableWidget { border: none; font-size: 11px; }"
-            "QHeaderView::section { font-size: 10px; padding: 2px 4px; }")
+    def update_std_column(self, std_start_map: dict):
+        # Aún sin tabla: basta con que se construya con el mapa nuevo
+        self._args = self._args[:5] + (std_start_map,)
+        self._lookup = std_start_map
+        self._search_blob = None
 
-        # Columnas solicitadas: V, Señal, Arranca XRIO, Arranca Estándar
-        cols = ["V", "Señal", "Start XRIO", "Start Std"]
-        table.setColumnCount(len(cols))
-        table.setHorizontalHeaderLabels(cols)
-        table.setRowCount(len(self._standard_signals))
-        
-        # Modos de redimensionamiento
-        header = table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)            # V
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)          # Señal
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)            # Start XRIO
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)            # Start Std
 
-        table.setColumnWidth(0, 28)
-        table.setColumnWidth(2, 90)
-        table.setColumnWidth(3, 90)
+class LazyComparisonPlaceholder(_LazyBlock):
+    """Placeholder de un ComparisonBlockTable (bloque del estándar)."""
 
-        green = QColor("#198754")
-        red = QColor("#dc3545")
-        
-        for r, sig in enumerate(self._standard_signals):
-            std_name = sig['name']
-            std_start = sig['group']
-            
-            # Buscar en mapa XRIO
-            xrio_sig = self._xrio_signals_map.get(std_name.strip().upper())
-            exists = xrio_sig is not None
-
-            # Obtener Trigger XRIO
-            xrio_start_val = ""
-            if exists and hasattr(xrio_sig, 'trig_operation'):
-                xrio_start_val = xrio_sig.trig_operation
-            
-            # 1. Columna V
-            v_text = "✔" if exists else ""
-            chk = QTableWidgetItem(v_text)
-            chk.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if exists:
-                chk.setForeground(QBrush(green))
-            table.setItem(r, 0, chk)
-
-            # 2. Señal
-            name_it = QTableWidgetItem(std_name)
-            name_it.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            if not exists:
-                name_it.setForeground(QBrush(red))
-            table.setItem(r, 1, name_it)
-
-            # 3. Start XRIO
-            xrio_it = QTableWidgetItem(xrio_start_val if xrio_start_val else "-")
-            xrio_it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if "On" in xrio_start_val:
-                xrio_it.setForeground(QBrush(green))
-                xrio_it.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-            table.setItem(r, 2, xrio_it)
-
-            # 4. Start Std
-            std_it = QTableWidgetItem(std_start)
-            std_it.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            table.setItem(r, 3, std_it)
-
-        table.horizontalHeader().setStretchLastSection(False)
-        layout.addWidget(table)
+    TARGET = ComparisonBlockTable
+
+    def __init__(self, block_name: str, standard_signals: list, xrio_signals_map: dict,
+                 color_bg: str, color_fg: str, parent=None):
+        # La comparación no depende del std_start_map: update_std_column no hace nada
+        super().__init__(
+            (block_name, standard_signals, xrio_signals_map, color_bg, color_fg),
+            block_name, standard_signals, f"  {block_name}  ",
+            color_bg, color_fg, _comparison_row, xrio_signals_map, parent)
 
-    @property
-    def block_name(self) -> str:
-        return self._block_name
 
 class XRIOTab(QWidget):
     """Pestaña de XRIO con tablas organizadas por bloque."""
@@ -529,9 +788,19 @@ class XRIOTab(QWidget):
         excel_path = root_excel if os.path.exists(root_excel) else data_excel
         self._excel_parser = ExcelStandardParser(excel_path)
         self._std_start_map: dict[str, str] = {}
+        self._std_loader: _StdMapLoader | None = None
+        app = QCoreApplication.instance()
+        if app is not None:
+            # Primero se cancela la precarga; luego se espera a los cargadores
+            app.aboutToQuit.connect(_shutdown_sheet_pool)
+            app.aboutToQuit.connect(_wait_std_loaders)
         self._xrio_data: XRIOData | None = None
         self._block_widgets: list[BlockTable] = []
-        self._comparison_widgets: list[ComparisonBlockTable] = []
+        # Bloques aún sin construir (se materializan al entrar al área visible)
+        self._lazy_blocks: list[_LazyBlock] = []
+        # Primera fila libre del grid tras los bloques XRIO
+        self._next_comparison_row = 0
+        self._comparison_widgets: list[ComparisonBlockTable | LazyComparisonPlaceholder] = []
         self._setup_ui()
 
     # ─── UI ───────────────────────────────────────────────────────────
@@ -545,7 +814,7 @@ class XRIOTab(QWidget):
         toolbar.setSpacing(6)
 
         self._btn_load = QPushButton("Abrir XRIO")
-        self._btn_load.setProperty("cssClass", "primary")
+        self._btn_load.setObjectName("primaryButton")
         self._btn_load.setFixedHeight(26)
         self._btn_load.setCursor(Qt.CursorShape.PointingHandCursor)
         self._btn_load.clicked.connect(self._load_file)
@@ -560,12 +829,21 @@ class XRIOTab(QWidget):
         self._search = QLineEdit()
         self._search.setPlaceholderText("🔍 Buscar señal...")
         self._search.setFixedWidth(200)
-        self._search.textChanged.connect(self._apply_filter)
+
+        # Debounce: el filtro corre una vez al pausar, no por cada tecla
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self._search.textChanged.connect(
+            lambda _text: self._filter_timer.start())
 
         self._filter_type = QComboBox()
         self._filter_type.addItems(["Todos", "Analógicos (AxRADR)", "Binarios (BxRBDR)"])
         self._filter_type.setFixedWidth(160)
-        self._filter_type.currentIndexChanged.connect(self._apply_filter)
+        # Cambio discreto: se filtra en el acto, sin esperar el debounce
+        self._filter_type.currentIndexChanged.connect(
+            lambda _index: self._apply_filter())
 
         toolbar.addWidget(self._search)
         toolbar.addWidget(self._filter_type)
@@ -598,14 +876,9 @@ class XRIOTab(QWidget):
         self._scroll.setStyleSheet(
             "QScrollArea { border: none; background-color: #f4f5f7; }")
 
-        self._grid_container = QWidget()
-        self._grid_container.setStyleSheet("background-color: #f4f5f7;")
-        self._grid_layout = QGridLayout(self._grid_container)
-        self._grid_layout.setSpacing(6)
-        self._grid_layout.setContentsMargins(2, 2, 2, 2)
-        self._grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop) # Removed AlignLeft to allow stretching
-
-        self._scroll.setWidget(self._grid_container)
+        self._new_grid_container()
+        self._scroll.verticalScrollBar().valueChanged.connect(
+            lambda _value: self._materialize_visible())
         root.addWidget(self._scroll, 1)
 
         # ── Placeholder cuando no hay datos ──
@@ -616,6 +889,19 @@ class XRIOTab(QWidget):
             "color: #adb5bd; font-size: 13px; padding: 40px;")
         self._grid_layout.addWidget(self._placeholder, 0, 0, 1, 3)
 
+    def _new_grid_container(self):
+        """Crea un contenedor + QGridLayout vacíos y los monta en el scroll."""
+        self._grid_container = QWidget()
+        # Con selector: una regla sin selector se heredaría a todos los bloques
+        self._grid_container.setObjectName("xrioGrid")
+        self._grid_container.setStyleSheet(
+            "QWidget#xrioGrid { background-color: #f4f5f7; }")
+        self._grid_layout = QGridLayout(self._grid_container)
+        self._grid_layout.setSpacing(6)
+        self._grid_layout.setContentsMargins(2, 2, 2, 2)
+        self._grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop) # Removed AlignLeft to allow stretching
+        self._scroll.setWidget(self._grid_container)
+
     # ─── Cargar archivo ───────────────────────────────────────────────
     def _load_file(self):
         path, _ = QFileDialog.getOpenFileName(
@@ -635,11 +921,10 @@ class XRIOTab(QWidget):
         # Paso 2: actualización de UI con protección de errores
         warnings = []
 
-        try:
-            self._std_start_map = self._build_std_start_map()
-        except Exception as e:
-            self._std_start_map = {}
-            warnings.append(f"No se pudo cargar estándar XLSX para validación: {e}")
+        # Las tablas se muestran ya con V / Start Std vacíos; el estándar XLSX
+        # se parsea en segundo plano y se aplica al terminar
+        self._std_start_map = {}
+        self._start_std_loader()
 
         try:
             self._update_relay_bar()
@@ -684,15 +969,23 @@ class XRIOTab(QWidget):
         self._clear_grid()
         current_row = 0
 
+        # Vista de solo lectura del mapa, compartida por referencia con todas las tablas
+        frozen_map = MappingProxyType(self._std_start_map)
+
         # Mostrar BxRBDR (Disturbance Report) como parte importante del XRIO
         if self._xrio_data.disturbance_report_signals:
             dr_widget = DisturbanceReportTable(
                 self._xrio_data.disturbance_report_signals,
-                self._std_start_map
+                frozen_map
             )
             self._block_widgets.append(dr_widget)
             self._grid_layout.addWidget(dr_widget, current_row, 0, 1, 2)
             current_row += 1
+        self._next_comparison_row = current_row
+
+        # Claves de búsqueda normalizadas una sola vez por carga
+        _normalize_names(self._xrio_data.analog_signals)
+        _normalize_names(self._xrio_data.binary_signals)
 
         # Agrupar señales por bloque
         analog_blocks = self._group_by_block(self._xrio_data.analog_signals)
@@ -709,75 +1002,135 @@ class XRIOTab(QWidget):
 
         # Menos columnas para mejorar legibilidad y espacio por tabla
         max_cols = 2
-        row, col = current_row, 0
-        color_idx = 0
-
-        for block_name, signals, sig_type in all_blocks:
-            bg, fg = _BLOCK_COLORS[color_idx % len(_BLOCK_COLORS)]
-            widget = BlockTable(block_name, signals, sig_type, bg, fg, self._std_start_map)
+        colors = cycle(_BLOCK_COLORS)
+
+        for i, (block_name, signals, sig_type) in enumerate(all_blocks):
+            r, c = divmod(i, max_cols)
+            bg, fg = next(colors)
+            # La tabla real se construye cuando el bloque entra al área visible
+            widget = LazyBlockPlaceholder(
+                block_name, signals, sig_type, bg, fg, frozen_map)
             self._block_widgets.append(widget)
-            self._grid_layout.addWidget(widget, row, col)
-
-            col += 1
-            color_idx += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+            self._lazy_blocks.append(widget)
+            self._grid_layout.addWidget(widget, current_row + r, c)
+        # Filas ocupadas = ceil(bloques / columnas)
+        self._next_comparison_row = current_row - (-len(all_blocks) // max_cols)
+
+        # Tras el primer layout se conocen las posiciones reales
+        QTimer.singleShot(0, self._materialize_visible)
+
+    def _materialize(self, placeholder: _LazyBlock) -> _BaseBlockTable:
+        """Reemplaza un placeholder por su tabla real en la misma celda del grid."""
+        hidden = placeholder.isHidden()
+        widget = placeholder.build()
+        self._grid_layout.replaceWidget(placeholder, widget)
+        if hidden:
+            widget.hide()
+        for widgets in (self._block_widgets, self._comparison_widgets):
+            if placeholder in widgets:
+                widgets[widgets.index(placeholder)] = widget
+                break
+        self._lazy_blocks.remove(placeholder)
+        placeholder.hide()
+        placeholder.deleteLater()
+        return widget
+
+    def _materialize_visible(self):
+        """Construye los bloques pendientes que intersectan el viewport (con margen)."""
+        if not self._lazy_blocks:
+            return
+        viewport = self._scroll.viewport()
+        area = viewport.rect().adjusted(0, -200, 0, 200)
+        for placeholder in list(self._lazy_blocks):
+            if not placeholder.isVisible():
+                continue
+            top_left = placeholder.mapTo(viewport, QPoint(0, 0))
+            if QRect(top_left, placeholder.size()).intersects(area):
+                self._materialize(placeholder)
 
-    def _build_std_start_map(self) -> dict[str, str]:
-        """Construye mapa de validación desde XLSX: NOMBRE_SEÑAL -> Start Std."""
-        std_map: dict[str, str] = {}
-        if not self._xrio_data:
-            return std_map
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._materialize_visible()
 
+    def _start_std_loader(self):
+        """Lanza el parseo del XLSX (NOMBRE_SEÑAL -> Start Std) en un QThread."""
+        self._std_loader = None
         relay_model = (self._xrio_data.relay.model or "").strip()
         if not relay_model:
-            return std_map
-
-        available_models = self._excel_parser.get_available_models()
-        best_match = None
-        for model in available_models:
-            if model.upper() in relay_model.upper() or relay_model.upper() in model.upper():
-                best_match = model
-                break
-
-        if not best_match:
-            return std_map
+            return
 
-        standard_data = self._excel_parser.parse_sheet(best_match)
-        for _, rows in standard_data.items():
-            for row in rows:
-                signal_name = (row.get('name') or '').strip()
-                start_std = (row.get('group') or '').strip()
-                if signal_name and signal_name.upper() not in std_map:
-                    std_map[signal_name.upper()] = start_std
+        # Sin padre: el hilo sobrevive a otra carga o a la destrucción de la
+        # pestaña; _LIVE_LOADERS lo mantiene vivo y aboutToQuit lo espera
+        loader = _StdMapLoader(self._excel_parser.file_path, relay_model)
+        loader.ready.connect(self._apply_std_map)
+        loader.failed.connect(self._on_std_map_failed)
+        loader.finished.connect(lambda: _LIVE_LOADERS.discard(loader))
+        loader.finished.connect(loader.deleteLater)
+        _LIVE_LOADERS.add(loader)
+        self._std_loader = loader
+        loader.start()
+
+    def _apply_std_map(self, std_map: dict):
+        """Parchea las columnas V / Start Std de todos los bloques sin reconstruirlos."""
+        if self.sender() is not self._std_loader:
+            return  # resultado de una carga anterior
+        self._std_start_map = std_map
+        frozen_map = MappingProxyType(std_map)
+        for w in self._block_widgets:
+            w.update_std_column(frozen_map)
 
-        return std_map
+    def _on_std_map_failed(self, message: str):
+        if self.sender() is not self._std_loader:
+            return
+        QMessageBox.warning(
+            self, "XRIO cargado con advertencias",
+            f"No se pudo cargar estándar XLSX para validación: {message}")
 
-    def _group_by_block(self, signals: list) -> OrderedDict:
-        blocks = OrderedDict()
+    def _group_by_block(self, signals: list) -> dict[str, list]:
+        # Un solo hash por señal; dict conserva el orden de aparición de los bloques
+        blocks: defaultdict[str, list] = defaultdict(list)
         for sig in signals:
-            bname = sig.xrio_block or "SIN_BLOQUE"
-            if bname not in blocks:
-                blocks[bname] = []
-            blocks[bname].append(sig)
-        return blocks
+            blocks[sig.xrio_block or "SIN_BLOQUE"].append(sig)
+        return dict(blocks)
+
+    @contextmanager
+    def _frozen_grid(self):
+        """
+        Suspende repintado y relayout del grid mientras se agregan bloques.
+        El scroll no notifica cambios de rango en medio: los llamadores
+        materializan lo visible una vez, con las posiciones ya definitivas.
+        """
+        self._grid_container.setUpdatesEnabled(False)
+        self._grid_layout.setEnabled(False)
+        blocker = QSignalBlocker(self._scroll.verticalScrollBar())
+        try:
+            yield
+        finally:
+            # Un único relayout al final en vez de uno por widget
+            self._grid_layout.setEnabled(True)
+            self._grid_layout.activate()
+            blocker.unblock()
+            self._grid_container.setUpdatesEnabled(True)
 
     def _clear_grid(self):
-        for w in self._block_widgets:
-            self._grid_layout.removeWidget(w)
-            w.deleteLater()
+        # Soltar las señales de los modelos antes de destruir las tablas
+        for w in self._block_widgets + self._comparison_widgets:
+            model = getattr(w, '_model', None)
+            if model is not None:
+                model.clear()
         self._block_widgets.clear()
-        
-        for w in self._comparison_widgets:
-            self._grid_layout.removeWidget(w)
-            w.deleteLater()
+        self._lazy_blocks.clear()
         self._comparison_widgets.clear()
+        self._next_comparison_row = 0
 
-        # Remover placeholder si existe
-        if self._placeholder:
-            self._grid_layout.removeWidget(self._placeholder)
-            self._placeholder.hide()
+        # Se descarta el contenedor completo (un solo deleteLater) en vez de
+        # quitar bloque por bloque; el placeholder pasa oculto al nuevo
+        old_container = self._scroll.takeWidget()
+        self._new_grid_container()
+        self._placeholder.setParent(self._grid_container)
+        self._placeholder.hide()
+        if old_container is not None:
+            old_container.deleteLater()
 
     def _build_comparison_grid(self):
         """Construye las tablas de comparación con el estándar de Excel."""
@@ -790,56 +1143,46 @@ class XRIOTab(QWidget):
             return
         
         # Buscar la hoja correspondiente en el Excel
-        available_models = self._excel_parser.get_available_models()
-        best_match = None
-        for m in available_models:
-            if m.upper() in relay_model.upper() or relay_model.upper() in m.upper():
-                best_match = m
-                break
+        excel_path = self._excel_parser.file_path
+        mtime_ns = os.stat(excel_path).st_mtime_ns
+        best_match = _match_model(excel_path, mtime_ns, relay_model.upper())
         
         if not best_match:
             return  # No hay match, no mostrar comparación
         
-        # Obtener los bloques del estándar
-        standard_data = self._excel_parser.parse_sheet(best_match)
+        # Obtener los bloques del estándar (cacheados por fecha del XLSX)
+        standard_data = _cached_sheet(excel_path, mtime_ns, best_match)
         if not standard_data:
             return
         
         # Mapa de señales del reporte de disturbios: { NOMBRE_UPPER: objeto_señal }
-        # Usamos disturbance_report_signals porque son las que tienen 'Trig Oper'
-        xrio_dr_map = {}
-        if self._xrio_data.disturbance_report_signals:
-            for s in self._xrio_data.disturbance_report_signals:
-                name_key = s.name.strip().upper()
-                xrio_dr_map[name_key] = s
-        
-        # Determinar la fila de inicio para las tablas de comparación
-        # (después de las tablas de señales XRIO)
-        current_row = 0
-        for w in self._block_widgets:
-            current_row = max(current_row, self._grid_layout.getItemPosition(
-                self._grid_layout.indexOf(w))[0] + 1)
+        # Usamos disturbance_report_signals porque son las que tienen 'Trig Oper';
+        # el parser lo arma una vez por archivo (claves internadas)
+        xrio_dr_map = self._xrio_data.dr_signals_by_name
         
-        row, col = current_row, 0
+        # Las tablas de comparación van después de las tablas de señales XRIO
+        start_row = self._next_comparison_row
         max_cols = 2
-        color_idx = 0
+        colors = cycle(_BLOCK_COLORS)
         
-        for block_name, std_sigs in standard_data.items():
-            bg, fg = _BLOCK_COLORS[color_idx % len(_BLOCK_COLORS)]
-            
-            # Pasar el mapa de objetos en lugar de lista de nombres
-            widget = ComparisonBlockTable(block_name, std_sigs, xrio_dr_map, bg, fg)
-            self._comparison_widgets.append(widget)
-            self._grid_layout.addWidget(widget, row, col)
-            
-            col += 1
-            color_idx += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+        with self._frozen_grid():
+            for i, (block_name, std_sigs) in enumerate(standard_data.items()):
+                r, c = divmod(i, max_cols)
+                bg, fg = next(colors)
+                
+                # Pasar el mapa de objetos en lugar de lista de nombres;
+                # la tabla real se construye al entrar al área visible
+                widget = LazyComparisonPlaceholder(block_name, std_sigs, xrio_dr_map, bg, fg)
+                self._comparison_widgets.append(widget)
+                self._lazy_blocks.append(widget)
+                self._grid_layout.addWidget(widget, start_row + r, c)
+
+        QTimer.singleShot(0, self._materialize_visible)
 
     # ─── Filtro ──────────────────────────────────────────────────────
     def _apply_filter(self):
+        # Una pasada con el texto actual cubre cualquier tecla pendiente
+        self._filter_timer.stop()
         text = self._search.text().strip().upper()
         ftype = self._filter_type.currentIndex()  # 0=all, 1=analog, 2=binary
 
@@ -849,34 +1192,22 @@ class XRIOTab(QWidget):
                 continue
 
             # Filtro por tipo
-            is_analog = w.block_name.upper().endswith("RADR") or "RADR" in w.block_name.upper()
-            if ftype == 1 and not is_analog:
+            if ftype == 1 and not w.is_analog:
                 w.hide()
                 continue
-            if ftype == 2 and is_analog:
+            if ftype == 2 and w.is_analog:
                 w.hide()
                 continue
 
-            # Filtro por texto
+            # Filtro por texto (en el nombre del bloque o en sus celdas)
             if text:
-                match = text in w.block_name.upper()
-                if not match:
-                    # Buscar en señales de la tabla
-                    tbl = w._table
-                    row_match = False
-                    for r in range(tbl.rowCount()):
-                        for c in range(tbl.columnCount()):
-                            item = tbl.item(r, c)
-                            if item and text in item.text().upper():
-                                row_match = True
-                                break
-                        if row_match:
-                            break
-                    match = row_match
-                w.setVisible(match)
+                w.setVisible(text in w.block_name_upper or w.matches(text))
             else:
                 w.show()
 
+        # Los bloques que quedaron a la vista tras filtrar se construyen ya
+        QTimer.singleShot(0, self._materialize_visible)
+
     # ─── API pública ─────────────────────────────────────────────────
     def get_xrio_data(self) -> XRIOData | None:
         return self._xrio_data